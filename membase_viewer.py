@@ -8,6 +8,41 @@ from pathlib import Path
 from typing import Dict, List
 
 
+def _conversation_files(conv_dir: Path) -> List[Path]:
+    """List conversation files, preferring live JSONL over archived JSON
+
+    The sync path appends `{id}.jsonl` (header line + one line per
+    message); `_finalize` may additionally write a rich `{id}.json`
+    archive. When both exist the JSONL is authoritative.
+    """
+    files = sorted(conv_dir.glob("*.json*"))
+    jsonl_stems = {f.stem for f in files if f.suffix == ".jsonl"}
+    return [
+        f for f in files
+        if f.suffix == ".jsonl" or f.stem not in jsonl_stems
+    ]
+
+
+def _load_conversation_file(file: Path) -> Dict:
+    """Parse one conversation file in either on-disk format
+
+    Returns a dict in the legacy rich-document shape (conversation
+    metadata plus a `messages` list) regardless of format.
+    """
+    if file.suffix == ".jsonl":
+        with open(file) as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines:
+            return {}
+        conv = dict(lines[0])
+        conv.setdefault("conversation_id", file.stem)
+        conv.setdefault("stored_at", conv.get("created_at", "N/A"))
+        conv["messages"] = lines[1:]
+        return conv
+    with open(file) as f:
+        return json.load(f)
+
+
 class MembaseStorageViewer:
     """View Membase storage data"""
     
@@ -58,15 +93,71 @@ class MembaseStorageViewer:
         
         conversations = []
         if conv_dir.exists():
-            for file in sorted(conv_dir.glob("*.json")):
+            for file in _conversation_files(conv_dir):
                 try:
-                    with open(file) as f:
-                        conversations.append(json.load(f))
+                    conv = _load_conversation_file(file)
+                    if conv:
+                        conversations.append(conv)
                 except:
                     pass
-        
+
         return conversations
-    
+
+    @staticmethod
+    def get_conversation_previews() -> List[Dict]:
+        """
+        Get lightweight previews of all stored conversations
+
+        Parses each file once and keeps only the listing fields
+        (id, message count, first message preview, stored_at) so the
+        full message payloads are freed immediately.
+        """
+        storage_path = MembaseStorageViewer.get_storage_path()
+        conv_dir = storage_path / "conversations"
+
+        previews = []
+        if conv_dir.exists():
+            for file in _conversation_files(conv_dir):
+                try:
+                    conv = _load_conversation_file(file)
+                except:
+                    continue
+                if not conv:
+                    continue
+                messages = conv.get('messages', [])
+                first_preview = ""
+                if messages:
+                    msg = messages[0]
+                    first_preview = (
+                        msg.get('content', msg.get('text', 'No content'))
+                        if isinstance(msg, dict) else str(msg)
+                    )[:150]
+                previews.append({
+                    "id": conv.get('conversation_id', conv.get('id', file.stem)),
+                    "msg_count": len(messages),
+                    "first_msg_preview": first_preview,
+                    "stored_at": conv.get('stored_at', 'N/A')
+                })
+
+        return previews
+
+    @staticmethod
+    def get_conversation(conversation_id: str) -> Dict:
+        """Get one full conversation by its id"""
+        storage_path = MembaseStorageViewer.get_storage_path()
+        conv_dir = storage_path / "conversations"
+
+        if conv_dir.exists():
+            for file in _conversation_files(conv_dir):
+                try:
+                    conv = _load_conversation_file(file)
+                except:
+                    continue
+                if conv and conv.get('conversation_id', conv.get('id', file.stem)) == conversation_id:
+                    return conv
+
+        return {}
+
     @staticmethod
     def get_sentiment() -> List[Dict]:
         """Get all stored sentiment data"""
@@ -75,13 +166,23 @@ class MembaseStorageViewer:
         
         sentiment = []
         if sentiment_dir.exists():
+            # Legacy one-document .json files plus the sink's appended
+            # {proposal_id}.jsonl files, one record per line
             for file in sorted(sentiment_dir.glob("*.json")):
                 try:
                     with open(file) as f:
                         sentiment.append(json.load(f))
                 except:
                     pass
-        
+            for file in sorted(sentiment_dir.glob("*.jsonl")):
+                try:
+                    with open(file) as f:
+                        sentiment.extend(
+                            json.loads(line) for line in f if line.strip()
+                        )
+                except:
+                    pass
+
         return sentiment
     
     @staticmethod
@@ -4,7 +4,8 @@ Registers and manages the immortal AI delegate identity on Membase
 """
 
 import os
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -15,12 +16,12 @@ except ImportError:
     MEMBASE_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentIdentity:
     """
     Represents EternalGov's decentralized identity on Membase
     """
-    
+
     agent_name: str
     membase_id: str
     membase_account: str
@@ -28,11 +29,21 @@ class AgentIdentity:
     registered_on_chain: bool = False
     chain_address: Optional[str] = None
     created_at: str = ""
-    
+
+    # Shared, immutable capability set: returned by reference instead of
+    # rebuilding a list per call; the frozenset gives O(1) "in" checks
+    _CAPABILITIES = (
+        "proposal_analysis",
+        "sentiment_tracking",
+        "autonomous_voting",
+        "memory_persistence",
+    )
+    _CAPABILITIES_SET = frozenset(_CAPABILITIES)
+
     def __init__(self, agent_name: str = "EternalGov"):
         """
         Initialize agent identity from environment or parameters
-        
+
         Args:
             agent_name: Name of the AI delegate
         """
@@ -40,6 +51,10 @@ class AgentIdentity:
         self.membase_id = os.getenv("MEMBASE_ID", f"{agent_name}_delegate")
         self.membase_account = os.getenv("MEMBASE_ACCOUNT", "default")
         self.secret_key = os.getenv("MEMBASE_SECRET_KEY", "")
+        # With slots there are no class-level defaults to fall back on,
+        # so every field must be assigned here
+        self.registered_on_chain = False
+        self.chain_address = None
         self.created_at = datetime.utcnow().isoformat()
     
     def get_identity_proof(self) -> dict:
@@ -58,17 +73,12 @@ class AgentIdentity:
             "identity_type": "autonomous_dao_delegate",
             "memory_layer": "membase",
             "created_at": self.created_at,
-            "capabilities": [
-                "proposal_analysis",
-                "sentiment_tracking",
-                "autonomous_voting",
-                "memory_persistence"
-            ]
+            "capabilities": self._CAPABILITIES
         }
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return self.get_identity_proof()
+
+    def has_capability(self, capability: str) -> bool:
+        """Check whether the delegate supports a capability"""
+        return capability in self._CAPABILITIES_SET
     
     def register_on_chain(self):
         """
@@ -84,6 +94,47 @@ class AgentIdentity:
             print(f"[MEMBASE] Successfully registered {self.agent_name} on-chain")
         except Exception as e:
             print(f"[ERROR] Failed to register on-chain: {str(e)}")
+
+    @classmethod
+    def register_many(cls, identities: List["AgentIdentity"]) -> None:
+        """
+        Register several agent identities on-chain without serializing
+        on per-registration chain latency
+
+        Uses a single batched transaction when the SDK supports it,
+        otherwise dispatches the registrations concurrently.
+
+        Args:
+            identities: Agent identities to register
+        """
+        if not identities:
+            return
+
+        if not MEMBASE_AVAILABLE:
+            names = ", ".join(a.agent_name for a in identities)
+            print(f"[PLACEHOLDER] Registering {names} on-chain (Membase SDK not available)")
+            return
+
+        if hasattr(membase_chain, "register_batch"):
+            try:
+                membase_chain.register_batch([a.agent_name for a in identities])
+                print(f"[MEMBASE] Registered {len(identities)} agents on-chain in one batch")
+                return
+            except Exception as e:
+                print(f"[ERROR] Batched registration failed: {str(e)}")
+                return
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                pool.submit(membase_chain.register, a.agent_name): a
+                for a in identities
+            }
+            for future, identity in futures.items():
+                try:
+                    future.result()
+                    print(f"[MEMBASE] Successfully registered {identity.agent_name} on-chain")
+                except Exception as e:
+                    print(f"[ERROR] Failed to register {identity.agent_name} on-chain: {str(e)}")
     
     def to_dict(self) -> dict:
         """Serialize identity to dictionary"""
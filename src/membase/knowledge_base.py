@@ -3,19 +3,93 @@ Governance Knowledge Base for EternalGov
 Stores and manages governance documents, proposals, and contextual data
 """
 
-from typing import List, Optional, Dict
+import json
+import queue
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+
+# The optional membase SDK and the heavy vector-search stack are
+# imported lazily on first knowledge-base construction so importing
+# this module stays cheap
+MEMBASE_KB_AVAILABLE = None
+ChromaKnowledgeBase = None
+Document = None
+
+VECTOR_SEARCH_AVAILABLE = None
+faiss = None
+np = None
+SentenceTransformer = None
+
+
+def _load_membase_kb() -> bool:
+    """Resolve the optional membase imports on first use"""
+    global MEMBASE_KB_AVAILABLE, ChromaKnowledgeBase, Document
+    if MEMBASE_KB_AVAILABLE is None:
+        try:
+            from membase.knowledge.chroma import ChromaKnowledgeBase as _Chroma
+            from membase.knowledge.document import Document as _Document
+            ChromaKnowledgeBase, Document = _Chroma, _Document
+            MEMBASE_KB_AVAILABLE = True
+        except ImportError:
+            MEMBASE_KB_AVAILABLE = False
+    return MEMBASE_KB_AVAILABLE
+
+
+def _load_vector_search() -> bool:
+    """Resolve the optional faiss / sentence-transformers imports"""
+    global VECTOR_SEARCH_AVAILABLE, faiss, np, SentenceTransformer
+    if VECTOR_SEARCH_AVAILABLE is None:
+        try:
+            import faiss as _faiss
+            import numpy as _np
+            from sentence_transformers import SentenceTransformer as _ST
+            faiss, np, SentenceTransformer = _faiss, _np, _ST
+            VECTOR_SEARCH_AVAILABLE = True
+        except ImportError:
+            VECTOR_SEARCH_AVAILABLE = False
+    return VECTOR_SEARCH_AVAILABLE
 
 try:
-    from membase.knowledge.chroma import ChromaKnowledgeBase
-    from membase.knowledge.document import Document
-    MEMBASE_KB_AVAILABLE = True
+    import orjson
 except ImportError:
-    MEMBASE_KB_AVAILABLE = False
+    orjson = None
+
+# Dimensionality of the all-MiniLM-L6-v2 sentence embeddings
+EMBEDDING_DIM = 384
+
+# Interned categorical values so every document shares one string object
+# per distinct source/type, making filter equality a pointer compare
+_SOURCES = {s: sys.intern(s) for s in (
+    "snapshot", "discourse", "commonwealth", "github", "twitter", "medium"
+)}
+_DOC_TYPES = {t: sys.intern(t) for t in (
+    "proposal", "discussion", "analysis", "article"
+)}
+
+
+@lru_cache(maxsize=1024)
+def _lower(s: str) -> str:
+    """Lowercase with memoization for repeated queries"""
+    return s.lower()
+
 
+def _quantize(vec):
+    """Quantize a float vector to int8 with a per-vector scale
 
-@dataclass
+    384 int8 bytes replace ~11 KB of boxed Python floats per document.
+    """
+    scale = float(np.max(np.abs(vec))) / 127.0 or 1.0
+    return np.round(vec / scale).astype(np.int8), scale
+
+
+@dataclass(slots=True)
 class GovernanceDocument:
     """Represents a governance document or proposal"""
     doc_id: str
@@ -23,8 +97,27 @@ class GovernanceDocument:
     source: str  # "snapshot", "discourse", "twitter", "medium", etc.
     doc_type: str  # "proposal", "discussion", "analysis", "article"
     metadata: dict = field(default_factory=dict)
-    embedding: Optional[List[float]] = None
-    added_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    embedding: Optional[object] = None  # int8-quantized np.ndarray
+    embedding_scale: float = 1.0  # per-vector dequantization scale
+    ts_ns: int = field(default_factory=time.time_ns)
+    content_lower: str = field(default="", repr=False)  # cached for search
+
+    def __post_init__(self):
+        if not self.content_lower:
+            self.content_lower = self.content.lower()
+
+    def dequantized_embedding(self):
+        """Reconstruct the float32 embedding from the int8 storage"""
+        if self.embedding is None:
+            return None
+        return self.embedding.astype(np.float32) * self.embedding_scale
+
+    @property
+    def added_at(self) -> str:
+        """ISO-8601 timestamp, formatted lazily from ts_ns"""
+        return datetime.fromtimestamp(
+            self.ts_ns / 1e9, tz=timezone.utc
+        ).isoformat()
 
 
 class GovernanceKnowledgeBase:
@@ -51,9 +144,42 @@ class GovernanceKnowledgeBase:
         self.membase_account = membase_account
         self.auto_upload = auto_upload
         self.documents: Dict[str, GovernanceDocument] = {}
-        
+
+        # Secondary indexes maintained at insert time so per-DAO and
+        # filtered lookups avoid scanning every document
+        self._by_dao: Dict[str, List[str]] = defaultdict(list)
+        self._by_type_source: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._type_counts: Counter = Counter()  # doc_type -> document count
+
+        # Initialize FAISS vector index for semantic search if available
+        if _load_vector_search():
+            try:
+                self.encoder = SentenceTransformer("all-MiniLM-L6-v2")
+                self._index = faiss.IndexFlatIP(EMBEDDING_DIM)
+                self._index_ids: List[str] = []
+                print(f"[MEMBASE] FAISS vector index initialized ({EMBEDDING_DIM}d)")
+            except Exception as e:
+                print(f"[WARNING] Could not initialize vector search: {str(e)}")
+                self.encoder = None
+                self._index = None
+                self._index_ids = []
+        else:
+            self.encoder = None
+            self._index = None
+            self._index_ids = []
+
+        # Background Hub sync: documents are queued and coalesced into
+        # batches by a worker thread so add_document never blocks on IO
+        self._sync_batch_size = 64
+        self._sync_max_wait = 0.05  # seconds to wait for a fuller batch
+        self._sync_q: "queue.Queue[GovernanceDocument]" = queue.Queue()
+        self._sync_thread = threading.Thread(
+            target=self._sync_worker, daemon=True, name="kb-hub-sync"
+        )
+        self._sync_thread.start()
+
         # Initialize real Membase knowledge base if available
-        if MEMBASE_KB_AVAILABLE:
+        if _load_membase_kb():
             try:
                 self.kb = ChromaKnowledgeBase(
                     persist_directory=persist_directory,
@@ -88,15 +214,144 @@ class GovernanceKnowledgeBase:
         doc = GovernanceDocument(
             doc_id=doc_id,
             content=content,
-            source=source,
-            doc_type=doc_type,
+            source=_SOURCES.get(source) or sys.intern(source),
+            doc_type=_DOC_TYPES.get(doc_type) or sys.intern(doc_type),
             metadata=metadata or {}
         )
         
         self.documents[doc_id] = doc
-        
+        self._register_document(doc)
+        self._index_document(doc)
+
         if self.auto_upload:
-            self._sync_to_hub(doc)
+            self._sync_q.put(doc)
+
+    def _register_document(self, doc: GovernanceDocument) -> None:
+        """Add a document to the secondary lookup indexes"""
+        self._by_type_source[(doc.doc_type, doc.source)].append(doc.doc_id)
+        self._type_counts[doc.doc_type] += 1
+        dao = doc.metadata.get("dao")
+        if dao:
+            self._by_dao[dao].append(doc.doc_id)
+
+    def remove_document(self, doc_id: str) -> None:
+        """Remove a document and keep the secondary indexes consistent"""
+        doc = self.documents.pop(doc_id, None)
+        if doc is None:
+            return
+
+        self._type_counts[doc.doc_type] -= 1
+        if self._type_counts[doc.doc_type] <= 0:
+            del self._type_counts[doc.doc_type]
+
+        type_source_ids = self._by_type_source.get((doc.doc_type, doc.source))
+        if type_source_ids and doc_id in type_source_ids:
+            type_source_ids.remove(doc_id)
+
+        dao = doc.metadata.get("dao")
+        dao_ids = self._by_dao.get(dao) if dao else None
+        if dao_ids and doc_id in dao_ids:
+            dao_ids.remove(doc_id)
+
+    def add_documents(self, docs: List[dict]) -> None:
+        """
+        Add a batch of documents in one pass
+
+        Encodes all contents in a single batched call and syncs the whole
+        batch to the Hub at once, instead of one round-trip per document.
+
+        Args:
+            docs: List of dicts with doc_id, content, source, doc_type
+                  and optional metadata keys
+        """
+        documents = [
+            GovernanceDocument(
+                doc_id=d["doc_id"],
+                content=d["content"],
+                source=_SOURCES.get(d["source"]) or sys.intern(d["source"]),
+                doc_type=_DOC_TYPES.get(d["doc_type"]) or sys.intern(d["doc_type"]),
+                metadata=d.get("metadata") or {}
+            )
+            for d in docs
+        ]
+
+        # Batch-encode all contents in one call
+        if self._index and documents:
+            try:
+                vecs = self.encoder.encode(
+                    [doc.content for doc in documents],
+                    batch_size=64,
+                    normalize_embeddings=True
+                )
+                self._index.add(np.asarray(vecs, dtype=np.float32))
+                for doc, vec in zip(documents, vecs):
+                    doc.embedding, doc.embedding_scale = _quantize(vec)
+                    self._index_ids.append(doc.doc_id)
+            except Exception as e:
+                print(f"[WARNING] Failed to batch-index documents: {str(e)}")
+
+        for doc in documents:
+            self.documents[doc.doc_id] = doc
+            self._register_document(doc)
+
+        if self.auto_upload:
+            self._sync_batch_to_hub(documents)
+
+    def flush(self) -> None:
+        """Block until all queued documents have been synced to the Hub"""
+        self._sync_q.join()
+
+    def _sync_worker(self) -> None:
+        """Drain the sync queue, coalescing documents into batches"""
+        while True:
+            batch = [self._sync_q.get()]
+            deadline = time.monotonic() + self._sync_max_wait
+            while len(batch) < self._sync_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._sync_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._sync_batch_to_hub(batch)
+            finally:
+                for _ in batch:
+                    self._sync_q.task_done()
+
+    def _sync_batch_to_hub(self, documents: List[GovernanceDocument]) -> None:
+        """Sync a batch of documents to Membase Hub in one call"""
+        if not documents:
+            return
+
+        if not self.kb or not MEMBASE_KB_AVAILABLE:
+            for doc in documents:
+                self._sync_to_hub(doc)
+            return
+
+        try:
+            self.kb.add_documents([
+                Document(content=doc.content, metadata=doc.metadata)
+                for doc in documents
+            ])
+            print(f"[MEMBASE] Synced batch of {len(documents)} documents to Hub")
+        except Exception as e:
+            print(f"[WARNING] Failed to sync document batch to Membase Hub: {str(e)}")
+
+    def _index_document(self, doc: GovernanceDocument) -> None:
+        """Encode a document and add it to the FAISS index"""
+        if not self._index:
+            return
+
+        try:
+            vec = self.encoder.encode(doc.content, normalize_embeddings=True)
+            doc.embedding, doc.embedding_scale = _quantize(vec)
+            self._index.add(vec[np.newaxis, :].astype(np.float32))
+            self._index_ids.append(doc.doc_id)
+        except Exception as e:
+            print(f"[WARNING] Failed to index document {doc.doc_id}: {str(e)}")
     
     def add_proposal(
         self,
@@ -187,26 +442,78 @@ class GovernanceKnowledgeBase:
         Returns:
             List of matching documents
         """
+        # Semantic search via FAISS inner-product index when available
+        if self._index and self._index.ntotal > 0:
+            return self._vector_search(query, doc_type, source, limit)
+
+        # Fallback: simple substring matching over the pre-filtered
+        # candidate set, stopping as soon as `limit` hits are found
+        query_lower = _lower(query)
+        matches = (
+            doc for doc in self._candidate_documents(doc_type, source)
+            if query_lower in doc.content_lower
+        )
+        return list(islice(matches, limit))
+
+    def _candidate_documents(
+        self,
+        doc_type: Optional[str],
+        source: Optional[str]
+    ):
+        """Narrow the search space using the (type, source) index"""
+        if not doc_type and not source:
+            return self.documents.values()
+
+        if doc_type and source:
+            doc_ids = self._by_type_source.get((doc_type, source), [])
+        else:
+            doc_ids = [
+                doc_id
+                for (t, s), ids in self._by_type_source.items()
+                if (not doc_type or t == doc_type) and (not source or s == source)
+                for doc_id in ids
+            ]
+
+        return [self.documents[doc_id] for doc_id in doc_ids if doc_id in self.documents]
+
+    def _vector_search(
+        self,
+        query: str,
+        doc_type: Optional[str],
+        source: Optional[str],
+        limit: int
+    ) -> List[GovernanceDocument]:
+        """Search the FAISS index, then apply metadata filters"""
+        query_vec = self.encoder.encode(query, normalize_embeddings=True)
+        # Over-fetch so post-filtering still yields up to `limit` results
+        k = min(limit * 4, self._index.ntotal)
+        _, indices = self._index.search(
+            query_vec[np.newaxis, :].astype(np.float32), k
+        )
+
         results = []
-        
-        for doc in self.documents.values():
-            # Apply filters
+        for idx in indices[0]:
+            if idx < 0:
+                continue
+            doc = self.documents.get(self._index_ids[idx])
+            if doc is None:
+                continue
             if doc_type and doc.doc_type != doc_type:
                 continue
             if source and doc.source != source:
                 continue
-            
-            # Simple substring matching (in production: semantic search)
-            if query.lower() in doc.content.lower():
-                results.append(doc)
-        
-        return results[:limit]
+            results.append(doc)
+            if len(results) >= limit:
+                break
+
+        return results
     
     def get_proposals_by_dao(self, dao_name: str) -> List[GovernanceDocument]:
         """Get all proposals for a specific DAO"""
+        doc_ids = self._by_dao.get(dao_name, [])
         return [
-            doc for doc in self.documents.values()
-            if doc.metadata.get("dao") == dao_name and doc.doc_type == "proposal"
+            self.documents[doc_id] for doc_id in doc_ids
+            if doc_id in self.documents and self.documents[doc_id].doc_type == "proposal"
         ]
     
     def _sync_to_hub(self, document: GovernanceDocument) -> None:
@@ -233,32 +540,32 @@ class GovernanceKnowledgeBase:
     def _save_to_disk(self, document: GovernanceDocument):
         """Save document to disk (Membase simulation)"""
         try:
-            import json
             from pathlib import Path
-            
+
             storage_dir = Path("/tmp/eternalgov_membase_storage/documents")
             storage_dir.mkdir(parents=True, exist_ok=True)
-            
+
+            payload = {
+                "doc_id": document.doc_id,
+                "content": document.content,
+                "source": document.source,
+                "doc_type": document.doc_type,
+                "metadata": document.metadata,
+                "stored_at": datetime.utcnow().isoformat(),
+                "membase_account": self.membase_account
+            }
+
             filepath = storage_dir / f"{document.doc_id}.json"
-            
-            with open(filepath, 'w') as f:
-                json.dump({
-                    "doc_id": document.doc_id,
-                    "content": document.content,
-                    "source": document.source,
-                    "doc_type": document.doc_type,
-                    "metadata": document.metadata,
-                    "stored_at": datetime.utcnow().isoformat(),
-                    "membase_account": self.membase_account
-                }, f, indent=2)
-            
+            with open(filepath, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(payload, indent=2).encode())
+
             print(f"[MEMBASE] ✅ Synced document {document.doc_id} to Membase Hub at {filepath}")
         except Exception as e:
             print(f"[WARNING] Failed to save to disk: {str(e)}")
     
     def get_document_count(self) -> dict:
         """Get count of documents by type"""
-        counts = {}
-        for doc in self.documents.values():
-            counts[doc.doc_type] = counts.get(doc.doc_type, 0) + 1
-        return counts
+        return dict(self._type_counts)
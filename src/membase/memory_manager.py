@@ -3,26 +3,90 @@ Membase Memory Management for EternalGov
 Handles multi-threaded conversation memory and decentralized storage
 """
 
+import json
+import queue
+import sys
+import threading
+import time
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 try:
-    from membase.memory.multi_memory import MultiMemory
-    from membase.memory.message import Message
-    MEMBASE_MEMORY_AVAILABLE = True
+    import orjson
 except ImportError:
-    MEMBASE_MEMORY_AVAILABLE = False
+    orjson = None
 
 
-@dataclass
+# Interned message roles so every message shares one string object per role
+_ROLES = {r: sys.intern(r) for r in ("assistant", "user", "system", "proposal")}
+
+
+def _iso(ts_ns: int) -> str:
+    """Format a nanosecond epoch timestamp as ISO-8601 UTC"""
+    return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _lower(s: str) -> str:
+    """Lowercase with memoization for repeated queries"""
+    return s.lower()
+
+
+def _dumps(obj) -> bytes:
+    """Serialize compact JSON, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+# The optional membase SDK is imported lazily on first manager
+# construction so importing this module stays cheap
+MEMBASE_MEMORY_AVAILABLE = None
+MultiMemory = None
+Message = None
+
+
+def _load_membase() -> bool:
+    """Resolve the optional membase imports on first use"""
+    global MEMBASE_MEMORY_AVAILABLE, MultiMemory, Message
+    if MEMBASE_MEMORY_AVAILABLE is None:
+        try:
+            from membase.memory.multi_memory import MultiMemory as _MultiMemory
+            from membase.memory.message import Message as _Message
+            MultiMemory, Message = _MultiMemory, _Message
+            MEMBASE_MEMORY_AVAILABLE = True
+        except ImportError:
+            MEMBASE_MEMORY_AVAILABLE = False
+    return MEMBASE_MEMORY_AVAILABLE
+
+
+@dataclass(slots=True)
 class MemoryMessage:
     """Represents a single memory message"""
     name: str
     content: str
     role: str  # "assistant", "user", "system", "proposal"
     metadata: dict = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    ts_ns: int = field(default_factory=time.time_ns)
+    content_lower: str = field(default="", repr=False)  # cached for search
+
+    def __post_init__(self):
+        if not self.content_lower:
+            self.content_lower = self.content.lower()
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 timestamp, formatted lazily from ts_ns"""
+        return _iso(self.ts_ns)
+
+
+@dataclass(slots=True)
+class ConversationMetadata:
+    """Per-conversation bookkeeping (nanosecond epoch timestamps)"""
+    created_at: int
+    last_updated: int
+    message_count: int = 0
 
 
 class MembaseMemoryManager:
@@ -42,10 +106,22 @@ class MembaseMemoryManager:
         self.membase_account = membase_account
         self.auto_upload = auto_upload
         self.conversations: Dict[str, List[MemoryMessage]] = {}
-        self.conversation_metadata: Dict[str, dict] = {}
-        
+        self.conversation_metadata: Dict[str, ConversationMetadata] = {}
+        self._persisted_counts: Dict[str, int] = {}  # conversation_id -> messages on disk
+        self._conv_fds: Dict[str, int] = {}  # conversation_id -> cached append fd
+
+        # Background Hub sync: conversation ids are queued and coalesced
+        # by a worker thread so add_message never blocks on network/disk
+        self._sync_batch_size = 64
+        self._sync_max_wait = 0.05  # seconds to wait for a fuller batch
+        self._sync_q: "queue.Queue[str]" = queue.Queue()
+        self._sync_thread = threading.Thread(
+            target=self._sync_worker, daemon=True, name="memory-hub-sync"
+        )
+        self._sync_thread.start()
+
         # Initialize real Membase MultiMemory if available
-        if MEMBASE_MEMORY_AVAILABLE:
+        if _load_membase():
             try:
                 self.mm = MultiMemory(
                     membase_account=membase_account,
@@ -77,27 +153,54 @@ class MembaseMemoryManager:
             name: Name of the agent/entity
             metadata: Additional metadata
         """
-        if conversation_id not in self.conversations:
+        now_ns = time.time_ns()
+
+        meta = self.conversation_metadata.get(conversation_id)
+        if meta is None:
             self.conversations[conversation_id] = []
-            self.conversation_metadata[conversation_id] = {
-                "created_at": datetime.utcnow().isoformat(),
-                "last_updated": datetime.utcnow().isoformat(),
-                "message_count": 0
-            }
-        
+            meta = ConversationMetadata(created_at=now_ns, last_updated=now_ns)
+            self.conversation_metadata[conversation_id] = meta
+
         msg = MemoryMessage(
             name=name,
             content=content,
-            role=role,
-            metadata=metadata or {}
+            role=_ROLES.get(role) or sys.intern(role),
+            metadata=metadata or {},
+            ts_ns=now_ns
         )
-        
+
         self.conversations[conversation_id].append(msg)
-        self.conversation_metadata[conversation_id]["last_updated"] = datetime.utcnow().isoformat()
-        self.conversation_metadata[conversation_id]["message_count"] += 1
+        meta.last_updated = now_ns
+        meta.message_count += 1
         
         if self.auto_upload:
-            self._sync_to_hub(conversation_id)
+            self._sync_q.put(conversation_id)
+
+    def flush(self) -> None:
+        """Block until all queued conversations have been synced"""
+        self._sync_q.join()
+
+    def _sync_worker(self) -> None:
+        """Drain the sync queue, coalescing bursts of messages so each
+        conversation is synced once per batch"""
+        while True:
+            batch = [self._sync_q.get()]
+            deadline = time.monotonic() + self._sync_max_wait
+            while len(batch) < self._sync_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._sync_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                for conversation_id in dict.fromkeys(batch):
+                    self._sync_to_hub(conversation_id)
+            finally:
+                for _ in batch:
+                    self._sync_q.task_done()
     
     def get_conversation(self, conversation_id: str) -> List[MemoryMessage]:
         """Retrieve all messages from a conversation"""
@@ -117,15 +220,38 @@ class MembaseMemoryManager:
         Returns:
             Dictionary of matching conversations
         """
+        query_lower = _lower(query)
         results = {}
         for conv_id, messages in self.conversations.items():
             matching_msgs = [
-                msg for msg in messages 
-                if query.lower() in msg.content.lower()
+                msg for msg in messages
+                if query_lower in msg.content_lower
             ]
             if matching_msgs:
                 results[conv_id] = matching_msgs
         return results
+
+    def has_matches(self, query: str) -> Dict[str, bool]:
+        """
+        Check which conversations contain a match, without collecting them
+
+        Stops at the first hit per conversation, so callers that only
+        need a yes/no (e.g. dashboard badges) skip the full search.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Dictionary of conversation_id -> whether any message matches
+        """
+        query_lower = _lower(query)
+        return {
+            conv_id: next(
+                (True for msg in messages if query_lower in msg.content_lower),
+                False
+            )
+            for conv_id, messages in self.conversations.items()
+        }
     
     def _sync_to_hub(self, conversation_id: str) -> None:
         """
@@ -151,45 +277,135 @@ class MembaseMemoryManager:
         except Exception as e:
             print(f"[WARNING] Failed to sync to Membase Hub: {str(e)}")
     
+    def _get_append_fd(self, conversation_id: str, filepath) -> int:
+        """Get a cached O_APPEND descriptor for a conversation file
+
+        Keeping the fd open avoids an open/close syscall pair per sync;
+        O_APPEND lets the kernel handle write positioning.
+        """
+        import os
+
+        fd = self._conv_fds.get(conversation_id)
+        if fd is None:
+            fd = os.open(
+                str(filepath), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            self._conv_fds[conversation_id] = fd
+        return fd
+
+    def close(self) -> None:
+        """Flush pending syncs and release cached file descriptors"""
+        import os
+
+        self.flush()
+        fds, self._conv_fds = self._conv_fds, {}
+        for fd in fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
     def _save_to_disk(self, conversation_id: str):
-        """Save conversation to disk (Membase simulation)"""
+        """Append new messages to disk as JSONL (Membase simulation)
+
+        Each message is one appended line, so per-sync IO is proportional
+        to the new messages rather than the whole conversation. All new
+        lines are serialized into one buffer and submitted as a single
+        write() against a cached append-mode descriptor.
+        """
         try:
-            import json
+            import os
             from pathlib import Path
-            
+
             storage_dir = Path("/tmp/eternalgov_membase_storage/conversations")
             storage_dir.mkdir(parents=True, exist_ok=True)
-            
-            filepath = storage_dir / f"{conversation_id}.json"
-            messages_data = [
-                {
+
+            filepath = storage_dir / f"{conversation_id}.jsonl"
+            messages = self.conversations[conversation_id]
+            persisted = self._persisted_counts.get(conversation_id, 0)
+
+            lines = []
+            # Write the header line only when the file is actually new:
+            # _persisted_counts is in-memory, so after a restart it
+            # reads 0 for a conversation whose header is already on
+            # disk, and a second header would be listed as a message
+            if persisted == 0 and not (
+                filepath.exists() and filepath.stat().st_size > 0
+            ):
+                lines.append(_dumps({
+                    "conversation_id": conversation_id,
+                    "created_at": _iso(self.conversation_metadata[conversation_id].created_at),
+                    "membase_account": self.membase_account
+                }))
+
+            for msg in messages[persisted:]:
+                lines.append(_dumps({
                     "name": msg.name,
                     "content": msg.content,
                     "role": msg.role,
                     "metadata": msg.metadata,
                     "timestamp": msg.timestamp
-                }
-                for msg in self.conversations[conversation_id]
-            ]
-            
-            with open(filepath, 'w') as f:
-                json.dump({
-                    "conversation_id": conversation_id,
-                    "messages": messages_data,
-                    "stored_at": datetime.utcnow().isoformat(),
-                    "membase_account": self.membase_account
-                }, f, indent=2)
-            
+                }))
+
+            if lines:
+                buf = b"\n".join(lines) + b"\n"
+                os.write(self._get_append_fd(conversation_id, filepath), buf)
+
+            self._persisted_counts[conversation_id] = len(messages)
             print(f"[MEMBASE] ✅ Synced conversation {conversation_id} to Membase Hub at {filepath}")
         except Exception as e:
             print(f"[WARNING] Failed to save to disk: {str(e)}")
+
+    def _finalize(self, conversation_id: str):
+        """Write the full conversation as a single rich JSON document
+
+        Only needed for archival/export; the hot sync path appends JSONL.
+        """
+        try:
+            from pathlib import Path
+
+            storage_dir = Path("/tmp/eternalgov_membase_storage/conversations")
+            storage_dir.mkdir(parents=True, exist_ok=True)
+
+            payload = {
+                "conversation_id": conversation_id,
+                "messages": [
+                    {
+                        "name": msg.name,
+                        "content": msg.content,
+                        "role": msg.role,
+                        "metadata": msg.metadata,
+                        "timestamp": msg.timestamp
+                    }
+                    for msg in self.conversations.get(conversation_id, [])
+                ],
+                "stored_at": datetime.utcnow().isoformat(),
+                "membase_account": self.membase_account
+            }
+
+            filepath = storage_dir / f"{conversation_id}.json"
+            with open(filepath, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(payload, indent=2).encode())
+        except Exception as e:
+            print(f"[WARNING] Failed to finalize conversation: {str(e)}")
     
     def export_conversation(self, conversation_id: str) -> dict:
         """Export conversation for analysis or archival"""
         messages = self.get_conversation(conversation_id)
+        meta = self.conversation_metadata.get(conversation_id)
+        meta_dict = {}
+        if meta is not None:
+            meta_dict = {
+                "created_at": _iso(meta.created_at),
+                "last_updated": _iso(meta.last_updated),
+                "message_count": meta.message_count
+            }
         return {
             "conversation_id": conversation_id,
-            "metadata": self.conversation_metadata.get(conversation_id, {}),
+            "metadata": meta_dict,
             "messages": [
                 {
                     "name": msg.name,
@@ -201,3 +417,11 @@ class MembaseMemoryManager:
                 for msg in messages
             ]
         }
+
+    def export_conversation_bytes(self, conversation_id: str) -> bytes:
+        """Export a conversation pre-serialized as JSON bytes
+
+        For callers that immediately serialize (Hub upload, HTTP), this
+        skips the intermediate dict-to-string round trip in the caller.
+        """
+        return _dumps(self.export_conversation(conversation_id))
@@ -1,12 +1,19 @@
 """
 Memory Layers for EternalGov
 Implements specialized memory systems for different types of governance knowledge
+
+Submodules are imported lazily (PEP 562) so agents that only use one
+layer don't pay import cost for the others.
 """
 
-from .proposal_memory import ProposalMemory
-from .sentiment_memory import SentimentMemory
-from .preference_memory import PreferenceMemory
-from .outcome_memory import OutcomeMemory
+import importlib
+
+_MODULES = {
+    "ProposalMemory": ".proposal_memory",
+    "SentimentMemory": ".sentiment_memory",
+    "PreferenceMemory": ".preference_memory",
+    "OutcomeMemory": ".outcome_memory",
+}
 
 __all__ = [
     "ProposalMemory",
@@ -14,3 +21,12 @@ __all__ = [
     "PreferenceMemory",
     "OutcomeMemory",
 ]
+
+
+def __getattr__(name):
+    module_path = _MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = obj  # cache so later lookups skip __getattr__
+    return obj
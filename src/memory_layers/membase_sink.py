@@ -0,0 +1,145 @@
+"""
+Shared Membase persistence sink for the memory layers
+
+The memory layers used to write their simulated Membase files inline on
+the recording path, paying disk latency per record. They now enqueue
+records here and a single daemon worker batches the writes (up to
+_BATCH_SIZE records or _MAX_WAIT seconds per wakeup), so ingestion never
+blocks on the filesystem.
+"""
+
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Disk location simulating Membase decentralized storage
+_STORAGE_ROOT = Path("/tmp/eternalgov_membase_storage")
+
+_BATCH_SIZE = 128
+_MAX_WAIT = 0.1  # seconds to wait for more records before flushing a batch
+
+# Timestamp cache: records landing within the same ~50 ms polling burst
+# share one formatted timestamp instead of allocating and formatting a
+# datetime each
+_TS_WINDOW_NS = 50_000_000
+_last_ts_ns = 0
+_last_iso = ""
+
+
+def now_iso_cached() -> str:
+    """Current UTC time in ISO format, refreshed at most every ~50 ms"""
+    global _last_ts_ns, _last_iso
+    ts_ns = time.monotonic_ns()
+    if ts_ns - _last_ts_ns >= _TS_WINDOW_NS:
+        _last_iso = datetime.now(timezone.utc).isoformat()
+        _last_ts_ns = ts_ns
+    return _last_iso
+
+
+_queue: "queue.Queue" = queue.Queue()
+_worker: threading.Thread = None
+_worker_lock = threading.Lock()
+_append_fhs: Dict[str, object] = {}  # "{kind}/{key}" -> cached append handle
+
+
+def put(kind: str, key: str, record: dict, mode: str = "append") -> None:
+    """
+    Queue a record for background persistence
+
+    Args:
+        kind: Storage category (subdirectory), e.g. "sentiment"
+        key: Filename stem within the category
+        record: JSON-serializable record
+        mode: "append" adds a line to {key}.jsonl; "replace" rewrites
+            {key}.json with the record as the whole document
+    """
+    _ensure_worker()
+    _queue.put((kind, key, record, mode))
+
+
+def flush() -> None:
+    """Block until every queued record has been written"""
+    _queue.join()
+
+
+def _ensure_worker() -> None:
+    """Start the writer thread on first use"""
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(
+                target=_worker_loop, name="membase-sink", daemon=True
+            )
+            _worker.start()
+
+
+def _worker_loop() -> None:
+    """Drain the queue in batches and write each batch in one pass"""
+    while True:
+        batch = [_queue.get()]
+        try:
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(_queue.get(timeout=_MAX_WAIT))
+                except queue.Empty:
+                    break
+            _write_batch(batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def _write_batch(batch) -> None:
+    """Persist a batch, grouping appends per target file"""
+    appends: Dict[str, list] = {}
+    replaces: Dict[str, dict] = {}
+
+    for kind, key, record, mode in batch:
+        target = f"{kind}/{key}"
+        if mode == "append":
+            appends.setdefault(target, []).append(record)
+        else:
+            replaces[target] = record  # last write within the batch wins
+
+    for target, records in appends.items():
+        try:
+            fh = _append_fhs.get(target)
+            if fh is None:
+                filepath = _STORAGE_ROOT / f"{target}.jsonl"
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                fh = _append_fhs[target] = open(filepath, 'ab')
+            # Compact C-level serialization, one write for the batch
+            fh.write(b"".join(_dumps(r) + b"\n" for r in records))
+            fh.flush()
+        except Exception as e:
+            print(f"[WARNING] Failed to sync {target}: {str(e)}")
+
+    for target, record in replaces.items():
+        try:
+            filepath = _STORAGE_ROOT / f"{target}.json"
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps_pretty(record))
+        except Exception as e:
+            print(f"[WARNING] Failed to sync {target}: {str(e)}")
@@ -3,12 +3,26 @@ Outcome Memory Layer for EternalGov
 Tracks proposal outcomes and correlations with memory layers
 """
 
+import sys
+import threading
+from array import array
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from datetime import datetime
 
+from . import membase_sink
 
-@dataclass
+# Lock shards for ingestion: hash-partitioned by DAO so concurrent
+# threads recording outcomes for different DAOs don't serialize
+_NUM_SHARDS = 16
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class ProposalOutcome:
     """Records the outcome of a proposal"""
     proposal_id: str
@@ -36,8 +50,29 @@ class OutcomeMemory:
         """
         self.membase_account = membase_account
         self.outcomes: Dict[str, ProposalOutcome] = {}
+        self.dao_index: Dict[str, List[str]] = {}  # dao -> [proposal_ids]
+        # dao -> running {passed, total, participation_sum}, kept in step
+        # with record_proposal_outcome so the rate getters are O(1)
+        self._dao_stats: Dict[str, Dict[str, float]] = {}
+        # dao -> contiguous float32 participation samples in recording
+        # order; preallocated with doubling growth so appends stay
+        # amortized O(1) and trend slicing is a cheap view
+        self._participation_buf: Dict[str, "np.ndarray"] = {}
+        self._participation_len: Dict[str, int] = {}
         self.prediction_accuracy: Dict[str, float] = {}  # dao -> accuracy
-    
+        # dao -> (weighted sum, weight) for the normalized moving average
+        # behind prediction_accuracy; avoids the cold-start bias of
+        # seeding a plain EWMA at 0.5
+        self._acc_state: Dict[str, tuple] = {}
+        # One lock per DAO shard keeps each DAO's compound updates
+        # (stats, index, participation buffer) atomic while letting
+        # other DAOs' ingestion proceed in parallel
+        self._shard_locks = [threading.Lock() for _ in range(_NUM_SHARDS)]
+
+    def _shard_lock(self, dao: str) -> threading.Lock:
+        """Pick the lock guarding this DAO's shard"""
+        return self._shard_locks[hash(dao) & (_NUM_SHARDS - 1)]
+
     def record_proposal_outcome(
         self,
         proposal_id: str,
@@ -58,8 +93,11 @@ class OutcomeMemory:
             participation_count: Number of voters
             total_eligible: Total eligible voters
         """
+        # One canonical str per DAO across all outcomes; equality checks
+        # on interned strings short-circuit on identity
+        dao = sys.intern(dao)
         participation_rate = participation_count / total_eligible if total_eligible > 0 else 0
-        
+
         outcome = ProposalOutcome(
             proposal_id=proposal_id,
             dao=dao,
@@ -67,11 +105,50 @@ class OutcomeMemory:
             final_votes=final_votes,
             participation_rate=participation_rate,
             participation_count=participation_count,
-            recorded_at=datetime.utcnow().isoformat()
+            recorded_at=membase_sink.now_iso_cached()
         )
         
-        self.outcomes[proposal_id] = outcome
+        with self._shard_lock(dao):
+            self.outcomes[proposal_id] = outcome
+            self.dao_index.setdefault(dao, []).append(proposal_id)
+
+            stats = self._dao_stats.setdefault(
+                dao, {"passed": 0, "total": 0, "participation_sum": 0.0}
+            )
+            stats["passed"] += 1 if passed else 0
+            stats["total"] += 1
+            stats["participation_sum"] += participation_rate
+            self._append_participation(dao, participation_rate)
+
         self._sync_to_membase(outcome)
+
+    def _append_participation(self, dao: str, rate: float) -> None:
+        """Append a participation sample to the DAO's float32 buffer"""
+        if not NUMPY_AVAILABLE:
+            # array('f') keeps the 4-byte-per-sample layout without NumPy
+            self._participation_buf.setdefault(dao, array('f')).append(rate)
+            return
+
+        buf = self._participation_buf.get(dao)
+        n = self._participation_len.get(dao, 0)
+        if buf is None:
+            buf = np.empty(16, dtype=np.float32)
+            self._participation_buf[dao] = buf
+        elif n == len(buf):
+            grown = np.empty(len(buf) * 2, dtype=np.float32)
+            grown[:n] = buf
+            buf = self._participation_buf[dao] = grown
+        buf[n] = rate
+        self._participation_len[dao] = n + 1
+
+    def _participation_view(self, dao: str):
+        """Return the filled portion of the DAO's participation buffer"""
+        buf = self._participation_buf.get(dao)
+        if buf is None:
+            return array('f')
+        if not NUMPY_AVAILABLE:
+            return buf
+        return buf[:self._participation_len.get(dao, 0)]
     
     def record_prediction(
         self,
@@ -104,7 +181,7 @@ class OutcomeMemory:
     
     def get_dao_outcomes(self, dao: str) -> List[ProposalOutcome]:
         """Get all outcomes for a DAO"""
-        return [o for o in self.outcomes.values() if o.dao == dao]
+        return [self.outcomes[pid] for pid in self.dao_index.get(dao, [])]
     
     def get_average_participation(self, dao: str) -> float:
         """
@@ -116,10 +193,10 @@ class OutcomeMemory:
         Returns:
             Average participation rate
         """
-        outcomes = self.get_dao_outcomes(dao)
-        if not outcomes:
+        stats = self._dao_stats.get(dao)
+        if not stats or stats["total"] == 0:
             return 0.0
-        return sum(o.participation_rate for o in outcomes) / len(outcomes)
+        return stats["participation_sum"] / stats["total"]
     
     def get_pass_rate(self, dao: str) -> float:
         """
@@ -131,11 +208,10 @@ class OutcomeMemory:
         Returns:
             Percentage of proposals that passed (0.0 to 1.0)
         """
-        outcomes = self.get_dao_outcomes(dao)
-        if not outcomes:
+        stats = self._dao_stats.get(dao)
+        if not stats or stats["total"] == 0:
             return 0.5
-        passed = sum(1 for o in outcomes if o.passed)
-        return passed / len(outcomes)
+        return stats["passed"] / stats["total"]
     
     def get_prediction_accuracy(self, dao: Optional[str] = None) -> float:
         """
@@ -168,26 +244,32 @@ class OutcomeMemory:
         Returns:
             Dictionary of trend analysis
         """
-        outcomes = self.get_dao_outcomes(dao)[-num_recent:]
-        
-        if not outcomes:
+        recent_ids = self.dao_index.get(dao, [])[-num_recent:]
+
+        if not recent_ids:
             return {}
-        
+
+        # One read of the running stats covers both headline numbers
+        stats = self._dao_stats[dao]
+        total = stats["total"]
+
         analysis = {
-            "pass_rate": self.get_pass_rate(dao),
-            "avg_participation": self.get_average_participation(dao),
+            "pass_rate": stats["passed"] / total,
+            "avg_participation": stats["participation_sum"] / total,
             "recent_outcomes": [],
-            "participation_trend": []
+            # Single bulk conversion from the float32 buffer instead of
+            # appending boxed floats one at a time
+            "participation_trend": self._participation_view(dao)[-num_recent:].tolist()
         }
-        
-        for outcome in outcomes:
+
+        for proposal_id in recent_ids:
+            outcome = self.outcomes[proposal_id]
             analysis["recent_outcomes"].append({
                 "proposal_id": outcome.proposal_id,
                 "passed": outcome.passed,
                 "participation": outcome.participation_rate
             })
-            analysis["participation_trend"].append(outcome.participation_rate)
-        
+
         return analysis
     
     def _update_accuracy_metrics(self, proposal_id: str, was_correct: bool) -> None:
@@ -195,12 +277,43 @@ class OutcomeMemory:
         # Get DAO from outcome
         if proposal_id in self.outcomes:
             dao = self.outcomes[proposal_id].dao
-            
-            # Exponential moving average of accuracy
-            current_acc = self.prediction_accuracy.get(dao, 0.5)
+
+            # Normalized exponential moving average: track the decayed
+            # weighted sum and total weight, then report their ratio so
+            # early samples aren't diluted by the arbitrary 0.5 seed
+            beta = 0.8
             new_value = 1.0 if was_correct else 0.0
-            self.prediction_accuracy[dao] = current_acc * 0.8 + new_value * 0.2
+            with self._shard_lock(dao):
+                xw, w = self._acc_state.get(dao, (0.0, 0.0))
+                xw = beta * xw + new_value
+                w = beta * w + 1.0
+                self._acc_state[dao] = (xw, w)
+                self.prediction_accuracy[dao] = xw / w
     
+    def flush(self) -> None:
+        """Block until queued outcome records have been persisted"""
+        membase_sink.flush()
+
     def _sync_to_membase(self, outcome: ProposalOutcome) -> None:
         """Sync outcome to Membase for decentralized storage"""
         print(f"[MEMBASE] Syncing outcome for {outcome.proposal_id} to Membase")
+
+        # Hand the record to the shared sink; the background worker
+        # batches the JSONL appends off the recording path
+        try:
+            membase_sink.put(
+                "outcomes",
+                outcome.dao,
+                {
+                    "proposal_id": outcome.proposal_id,
+                    "dao": outcome.dao,
+                    "passed": outcome.passed,
+                    "final_votes": outcome.final_votes,
+                    "participation_rate": outcome.participation_rate,
+                    "participation_count": outcome.participation_count,
+                    "recorded_at": outcome.recorded_at,
+                    "membase_account": "default"
+                }
+            )
+        except Exception as e:
+            print(f"[WARNING] Failed to sync outcome: {str(e)}")
@@ -3,12 +3,14 @@ Preference Memory Layer for EternalGov
 Learns and stores community governance preferences and values
 """
 
+import sys
+from collections import Counter, deque
+from itertools import islice
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PreferencePattern:
     """Stores identified preference patterns"""
     pattern_id: str
@@ -35,7 +37,13 @@ class PreferenceMemory:
         self.membase_account = membase_account
         self.patterns: Dict[str, PreferencePattern] = {}
         self.voting_history: Dict[str, Dict[str, int]] = {}  # proposal_id -> {choice: votes}
+        # Bounded window of (proposal_id, votes) in recording order so
+        # pattern analysis never copies the full history
+        self._recent_votes: deque = deque(maxlen=200)
         self.category_success_rate: Dict[str, float] = {}  # category -> pass rate
+        # category -> precomputed preference label, refreshed whenever
+        # the success rate moves so prediction is a single dict.get
+        self._category_label: Dict[str, str] = {}
     
     def record_proposal_outcome(
         self,
@@ -55,15 +63,28 @@ class PreferenceMemory:
             passed: Whether proposal passed
             participation_rate: Voting participation percentage
         """
+        # One canonical str per category across the learned rates
+        category = sys.intern(category)
+
         self.voting_history[proposal_id] = votes
-        
+        self._recent_votes.append((proposal_id, votes))
+
         # Update category success rate
         current_rate = self.category_success_rate.get(category, 0.5)
         if passed:
             # Exponential moving average
-            self.category_success_rate[category] = current_rate * 0.7 + 1.0 * 0.3
+            rate = current_rate * 0.7 + 1.0 * 0.3
         else:
-            self.category_success_rate[category] = current_rate * 0.7 + 0.0 * 0.3
+            rate = current_rate * 0.7 + 0.0 * 0.3
+        self.category_success_rate[category] = rate
+
+        # Refresh the cached label here, off the prediction hot path
+        if rate > 0.65:
+            self._category_label[category] = "likely_support"
+        elif rate < 0.35:
+            self._category_label[category] = "likely_oppose"
+        else:
+            self._category_label[category] = "uncertain"
     
     def record_community_value(
         self,
@@ -139,31 +160,27 @@ class PreferenceMemory:
         Returns:
             Dictionary of voting pattern analysis
         """
-        recent_proposals = list(self.voting_history.items())[-num_proposals:]
-        
         analysis = {
             "average_participation": 0.0,
             "majority_threshold": 0.0,
-            "common_choices": {},
+            "common_choices": Counter(),
             "controversial_proposals": 0
         }
-        
-        if not recent_proposals:
-            return analysis
-        
-        # Analyze voting distributions
-        for proposal_id, votes in recent_proposals:
+
+        # Walk the bounded window newest-first and stop after
+        # num_proposals instead of copying the full history
+        for proposal_id, votes in islice(reversed(self._recent_votes), num_proposals):
             total_votes = sum(votes.values())
             if total_votes > 0:
                 # Track choice frequency
-                for choice, count in votes.items():
-                    analysis["common_choices"][choice] = analysis["common_choices"].get(choice, 0) + 1
-                
+                analysis["common_choices"].update(votes.keys())
+
                 # Identify controversial proposals (close votes)
                 max_votes = max(votes.values())
                 if max_votes < total_votes * 0.6:
                     analysis["controversial_proposals"] += 1
-        
+
+        analysis["common_choices"] = dict(analysis["common_choices"])
         return analysis
     
     def predict_proposal_preference(self, proposal: Dict) -> str:
@@ -176,13 +193,6 @@ class PreferenceMemory:
         Returns:
             Predicted preference: "likely_support", "likely_oppose", "uncertain"
         """
-        category = proposal.get("category", "general")
-        success_rate = self.get_category_success_rate(category)
-        
-        # Simple heuristic: use category success rate
-        if success_rate > 0.65:
-            return "likely_support"
-        elif success_rate < 0.35:
-            return "likely_oppose"
-        else:
-            return "uncertain"
+        # Single lookup against the label cache maintained at record
+        # time; unseen categories sit at the 0.5 prior, i.e. uncertain
+        return self._category_label.get(proposal.get("category", "general"), "uncertain")
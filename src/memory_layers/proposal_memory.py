@@ -3,12 +3,19 @@ Proposal Memory Layer for EternalGov
 Stores structured proposal data with vector embeddings for semantic search
 """
 
-from typing import Dict, List, Optional
+import re
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
 
+from . import membase_sink
 
-@dataclass
+# Tokenizer shared by indexing and querying so both sides agree on terms
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(slots=True)
 class ProposalMemoryEntry:
     """Stores a proposal in Membase"""
     proposal_id: str
@@ -44,6 +51,11 @@ class ProposalMemory:
         self.membase_account = membase_account
         self.proposals: Dict[str, ProposalMemoryEntry] = {}
         self.dao_index: Dict[str, List[str]] = {}  # dao -> [proposal_ids]
+        # Inverted index: token -> proposal_ids containing it, plus the
+        # lowercased title/body computed once at store time so search
+        # doesn't re-lower every proposal per query
+        self._token_index: Dict[str, Set[str]] = {}
+        self._lower_cache: Dict[str, Tuple[str, str]] = {}
     
     def store_proposal(
         self,
@@ -73,6 +85,10 @@ class ProposalMemory:
             url: Proposal URL
             category: Proposal category
         """
+        # One canonical str per DAO/category across all proposals
+        dao = sys.intern(dao)
+        category = sys.intern(category)
+
         entry = ProposalMemoryEntry(
             proposal_id=proposal_id,
             dao=dao,
@@ -92,7 +108,14 @@ class ProposalMemory:
         if dao not in self.dao_index:
             self.dao_index[dao] = []
         self.dao_index[dao].append(proposal_id)
-        
+
+        # Update search index
+        title_lower = title.lower()
+        body_lower = body.lower()
+        self._lower_cache[proposal_id] = (title_lower, body_lower)
+        for token in set(_TOKEN_RE.findall(title_lower)) | set(_TOKEN_RE.findall(body_lower)):
+            self._token_index.setdefault(token, set()).add(proposal_id)
+
         # In production: sync to Membase
         # from membase.knowledge.chroma import ChromaKnowledgeBase
         # kb.add_documents(Document(content=body, metadata={...}))
@@ -150,7 +173,18 @@ class ProposalMemory:
     def get_dao_proposals(self, dao: str) -> List[ProposalMemoryEntry]:
         """Get all proposals for a DAO"""
         proposal_ids = self.dao_index.get(dao, [])
-        return [self.proposals[pid] for pid in proposal_ids if pid in self.proposals]
+        if not proposal_ids:
+            return []
+        if len(proposal_ids) == 1:
+            entry = self.proposals.get(proposal_ids[0])
+            return [entry] if entry is not None else []
+        try:
+            # Single C-level bulk fetch instead of per-id dict lookups
+            return list(itemgetter(*proposal_ids)(self.proposals))
+        except KeyError:
+            # An indexed id is missing from the store; fall back to the
+            # filtering comprehension
+            return [self.proposals[pid] for pid in proposal_ids if pid in self.proposals]
     
     def search_proposals(
         self,
@@ -171,18 +205,40 @@ class ProposalMemory:
         """
         results = []
         query_lower = query.lower()
-        
-        for proposal in self.proposals.values():
+        query_tokens = _TOKEN_RE.findall(query_lower)
+
+        # Only the interior query tokens are guaranteed to appear as
+        # whole words in a substring match: the first token may match
+        # as the suffix of a larger word and the last as a prefix
+        # ("sip upgrade" matches "gossip upgrade"). So the postings
+        # intersection may prefilter on interior tokens only; queries
+        # with no interior tokens scan every cached lowercase text.
+        interior_tokens = query_tokens[1:-1]
+        if interior_tokens:
+            postings = [self._token_index.get(t) for t in interior_tokens]
+            if any(p is None for p in postings):
+                # An interior token never appears whole in any
+                # proposal; scan everything rather than prefilter
+                candidate_ids = self.proposals.keys()
+            else:
+                # Intersect postings, smallest set first
+                candidate_ids = set.intersection(*sorted(postings, key=len))
+        else:
+            candidate_ids = self.proposals.keys()
+
+        for proposal_id in candidate_ids:
+            proposal = self.proposals[proposal_id]
             # Apply filters
             if dao and proposal.dao != dao:
                 continue
             if category and proposal.category != category:
                 continue
-            
-            # Search in title and body
-            if query_lower in proposal.title.lower() or query_lower in proposal.body.lower():
+
+            # Verify the full phrase against the cached lowercase text
+            title_lower, body_lower = self._lower_cache[proposal_id]
+            if query_lower in title_lower or query_lower in body_lower:
                 results.append(proposal)
-        
+
         return results
     
     def update_status(self, proposal_id: str, status: str) -> None:
@@ -190,24 +246,22 @@ class ProposalMemory:
         if proposal_id in self.proposals:
             self.proposals[proposal_id].status = status
     
+    def flush(self) -> None:
+        """Block until queued proposal documents have been persisted"""
+        membase_sink.flush()
+
     def _sync_to_membase(self, entry: ProposalMemoryEntry) -> None:
         """Sync proposal to Membase for decentralized storage"""
         # Placeholder for Membase sync
         print(f"[MEMBASE] Syncing proposal {entry.proposal_id} to Membase")
-        
-        # Save to disk to simulate Membase
+
+        # Hand the document to the shared sink; the background worker
+        # writes it off the ingestion path
         try:
-            import json
-            from pathlib import Path
-            from datetime import datetime
-            
-            storage_dir = Path("/tmp/eternalgov_membase_storage/proposals")
-            storage_dir.mkdir(parents=True, exist_ok=True)
-            
-            filepath = storage_dir / f"{entry.dao}_{entry.proposal_id}.json"
-            
-            with open(filepath, 'w') as f:
-                json.dump({
+            membase_sink.put(
+                "proposals",
+                f"{entry.dao}_{entry.proposal_id}",
+                {
                     "proposal_id": entry.proposal_id,
                     "dao": entry.dao,
                     "title": entry.title,
@@ -222,10 +276,10 @@ class ProposalMemory:
                     "key_arguments": entry.key_arguments,
                     "expected_impact": entry.expected_impact,
                     "status": entry.status,
-                    "stored_at": datetime.utcnow().isoformat(),
+                    "stored_at": membase_sink.now_iso_cached(),
                     "membase_account": "default"
-                }, f, indent=2)
-            
-            print(f"[MEMBASE] ✅ Synced proposal to Membase at {filepath}")
+                },
+                mode="replace"
+            )
         except Exception as e:
             print(f"[WARNING] Failed to sync proposal: {str(e)}")
@@ -3,12 +3,68 @@ Sentiment Memory Layer for EternalGov
 Tracks community sentiment and opinions across sources
 """
 
+import json
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
-from datetime import datetime
 
+from . import membase_sink
 
-@dataclass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Disk location simulating Membase decentralized storage
+_STORAGE_DIR = Path("/tmp/eternalgov_membase_storage/sentiment")
+
+# Lock shards for ingestion: hash-partitioned by DAO so concurrent
+# threads recording sentiment for different DAOs don't serialize
+_NUM_SHARDS = 16
+
+# Consensus bands: bisect_left over the thresholds maps an overall score
+# to its label (strict > at each boundary, matching the old ladder)
+_CONSENSUS_THRESHOLDS = (-0.6, -0.2, 0.2, 0.6)
+_CONSENSUS_LABELS = (
+    "strong_opposition", "concern", "neutral", "moderate_support", "strong_support"
+)
+
+# Column dtypes for the struct-of-arrays numeric store: float32 scores,
+# int32 counters, and int8 source ids against the shared vocabulary
+_COL_DTYPES = (
+    ("score", "f4"),
+    ("support", "i4"),
+    ("opposition", "i4"),
+    ("neutral", "i4"),
+    ("src", "i1"),
+)
+
+
+def load_sentiment_jsonl(proposal_id: str) -> List[Dict]:
+    """
+    Load all persisted sentiment records for a proposal
+
+    Args:
+        proposal_id: Proposal ID
+
+    Returns:
+        List of sentiment record dictionaries, oldest first
+    """
+    filepath = _STORAGE_DIR / f"{proposal_id}.jsonl"
+    if not filepath.exists():
+        return []
+    with open(filepath) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@dataclass(slots=True)
 class SentimentEntry:
     """Stores sentiment data for a proposal"""
     proposal_id: str
@@ -19,7 +75,7 @@ class SentimentEntry:
     opposition_count: int
     neutral_count: int
     key_topics: List[str] = field(default_factory=list)
-    recorded_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    recorded_at: str = field(default_factory=membase_sink.now_iso_cached)
 
 
 class SentimentMemory:
@@ -37,8 +93,33 @@ class SentimentMemory:
         """
         self.membase_account = membase_account
         self.sentiment_entries: Dict[str, List[SentimentEntry]] = {}
-        self.sentiment_trends: Dict[str, List[float]] = {}  # proposal_id -> [scores over time]
-    
+        # proposal_id -> scores over time as packed 4-byte floats rather
+        # than a list of boxed Python floats
+        self.sentiment_trends: Dict[str, array] = {}
+        # Running aggregates maintained at record time so reads don't
+        # re-bucket the full entry history:
+        # proposal_id -> source -> [score_sum, support, opposition, entries]
+        self._agg: Dict[str, Dict[str, List[float]]] = {}
+        # proposal_id -> (score_sum, entry_count) across all sources
+        self._overall: Dict[str, tuple] = {}
+        # Struct-of-arrays numeric store: one set of parallel columns per
+        # proposal, preallocated with doubling growth, so the hot numbers
+        # sit contiguously instead of scattered across entry objects
+        self._cols: Dict[str, Dict[str, "np.ndarray"]] = {}
+        self._col_len: Dict[str, int] = {}
+        # Shared source vocabulary backing the int8 src column
+        self._source_vocab: Dict[str, int] = {}
+        self._source_names: List[str] = []
+        # One lock per DAO shard keeps each proposal's compound updates
+        # atomic while letting other DAOs' ingestion proceed in
+        # parallel; the shared source vocabulary has its own lock
+        self._shard_locks = [threading.Lock() for _ in range(_NUM_SHARDS)]
+        self._vocab_lock = threading.Lock()
+
+    def _shard_lock(self, dao: str) -> threading.Lock:
+        """Pick the lock guarding this DAO's shard"""
+        return self._shard_locks[hash(dao) & (_NUM_SHARDS - 1)]
+
     def record_sentiment(
         self,
         proposal_id: str,
@@ -63,6 +144,11 @@ class SentimentMemory:
             neutral_count: Number of neutral indicators
             topics: Key topics mentioned
         """
+        # One canonical str per DAO/source across all entries; the domain
+        # is tiny, so interning collapses millions of duplicates
+        dao = sys.intern(dao)
+        source = sys.intern(source)
+
         entry = SentimentEntry(
             proposal_id=proposal_id,
             dao=dao,
@@ -74,14 +160,75 @@ class SentimentMemory:
             key_topics=topics or []
         )
         
-        if proposal_id not in self.sentiment_entries:
-            self.sentiment_entries[proposal_id] = []
-            self.sentiment_trends[proposal_id] = []
-        
-        self.sentiment_entries[proposal_id].append(entry)
-        self.sentiment_trends[proposal_id].append(sentiment_score)
-        
+        with self._shard_lock(dao):
+            if proposal_id not in self.sentiment_entries:
+                self.sentiment_entries[proposal_id] = []
+                self.sentiment_trends[proposal_id] = array('f')
+
+            self.sentiment_entries[proposal_id].append(entry)
+            self.sentiment_trends[proposal_id].append(sentiment_score)
+
+            agg = self._agg.setdefault(proposal_id, {}).setdefault(
+                source, [0.0, 0, 0, 0]
+            )
+            agg[0] += sentiment_score
+            agg[1] += support_count
+            agg[2] += opposition_count
+            agg[3] += 1
+
+            score_sum, count = self._overall.get(proposal_id, (0.0, 0))
+            self._overall[proposal_id] = (score_sum + sentiment_score, count + 1)
+
+            if NUMPY_AVAILABLE:
+                self._append_columns(
+                    proposal_id, sentiment_score,
+                    support_count, opposition_count, neutral_count, source
+                )
+
         self._sync_to_membase(entry)
+
+    def _source_id(self, source: str) -> int:
+        """Map a source name to its stable int8 vocabulary id"""
+        source_id = self._source_vocab.get(source)
+        if source_id is None:
+            # The vocabulary spans all shards, so growing it takes its
+            # own lock; re-check after acquiring in case another thread
+            # registered the source first
+            with self._vocab_lock:
+                source_id = self._source_vocab.get(source)
+                if source_id is None:
+                    source_id = self._source_vocab[source] = len(self._source_names)
+                    self._source_names.append(source)
+        return source_id
+
+    def _append_columns(
+        self,
+        proposal_id: str,
+        sentiment_score: float,
+        support_count: int,
+        opposition_count: int,
+        neutral_count: int,
+        source: str
+    ) -> None:
+        """Append one row to the proposal's columnar store"""
+        cols = self._cols.get(proposal_id)
+        n = self._col_len.get(proposal_id, 0)
+        if cols is None:
+            cols = self._cols[proposal_id] = {
+                name: np.empty(16, dtype=dtype) for name, dtype in _COL_DTYPES
+            }
+        elif n == len(cols["score"]):
+            for name, dtype in _COL_DTYPES:
+                grown = np.empty(n * 2, dtype=dtype)
+                grown[:n] = cols[name]
+                cols[name] = grown
+
+        cols["score"][n] = sentiment_score
+        cols["support"][n] = support_count
+        cols["opposition"][n] = opposition_count
+        cols["neutral"][n] = neutral_count
+        cols["src"][n] = self._source_id(source)
+        self._col_len[proposal_id] = n + 1
     
     def get_proposal_sentiment(self, proposal_id: str) -> Dict:
         """
@@ -94,64 +241,76 @@ class SentimentMemory:
             Dictionary with sentiment analysis
         """
         entries = self.sentiment_entries.get(proposal_id, [])
-        
+
         if not entries:
             return {}
-        
-        # Aggregate by source
-        by_source = {}
-        for entry in entries:
-            if entry.source not in by_source:
-                by_source[entry.source] = []
-            by_source[entry.source].append(entry)
-        
-        # Calculate averages per source
-        aggregated = {}
-        for source, source_entries in by_source.items():
-            avg_score = sum(e.sentiment_score for e in source_entries) / len(source_entries)
-            total_support = sum(e.support_count for e in source_entries)
-            total_opposition = sum(e.opposition_count for e in source_entries)
-            
-            aggregated[source] = {
-                "average_sentiment": avg_score,
-                "support_count": total_support,
-                "opposition_count": total_opposition,
-                "entries": len(source_entries)
-            }
-        
-        # Overall sentiment
-        overall_score = sum(e.sentiment_score for e in entries) / len(entries)
-        
+
+        if NUMPY_AVAILABLE and proposal_id in self._cols:
+            aggregated = self._aggregate_columns(proposal_id)
+        else:
+            # Read the running per-source aggregates instead of
+            # re-bucketing the full entry history on every call
+            aggregated = {}
+            for source, (score_sum, support, opposition, count) in self._agg.get(proposal_id, {}).items():
+                aggregated[source] = {
+                    "average_sentiment": score_sum / count,
+                    "support_count": support,
+                    "opposition_count": opposition,
+                    "entries": count
+                }
+
+        overall_sum, overall_count = self._overall[proposal_id]
+
         return {
             "proposal_id": proposal_id,
-            "overall_sentiment_score": overall_score,
+            "overall_sentiment_score": overall_sum / overall_count,
             "by_source": aggregated,
-            "total_entries": len(entries),
-            "last_updated": entries[-1].recorded_at if entries else None
+            "total_entries": overall_count,
+            "last_updated": entries[-1].recorded_at
         }
     
+    def _aggregate_columns(self, proposal_id: str) -> Dict:
+        """Aggregate per-source stats from the columnar store in bulk"""
+        cols = self._cols[proposal_id]
+        n = self._col_len[proposal_id]
+        src = cols["src"][:n]
+        num_sources = len(self._source_names)
+
+        # One bincount pass per column instead of per-entry Python loops
+        counts = np.bincount(src, minlength=num_sources)
+        score_sums = np.bincount(src, weights=cols["score"][:n], minlength=num_sources)
+        support_sums = np.bincount(src, weights=cols["support"][:n], minlength=num_sources)
+        opposition_sums = np.bincount(src, weights=cols["opposition"][:n], minlength=num_sources)
+
+        aggregated = {}
+        for source_id, count in enumerate(counts):
+            if count:
+                aggregated[self._source_names[source_id]] = {
+                    "average_sentiment": float(score_sums[source_id]) / int(count),
+                    "support_count": int(support_sums[source_id]),
+                    "opposition_count": int(opposition_sums[source_id]),
+                    "entries": int(count)
+                }
+        return aggregated
+
     def get_sentiment_trend(self, proposal_id: str) -> List[float]:
         """Get sentiment trend over time"""
-        return self.sentiment_trends.get(proposal_id, [])
+        return list(self.sentiment_trends.get(proposal_id, ()))
     
-    def get_top_topics(self, proposal_id: str) -> Dict[str, int]:
+    def get_top_topics(self, proposal_id: str, limit: Optional[int] = None) -> Dict[str, int]:
         """
         Get most discussed topics for a proposal
-        
+
         Args:
             proposal_id: Proposal ID
-            
+            limit: Optional cap on the number of topics returned
+
         Returns:
-            Dictionary of topic: mention_count
+            Dictionary of topic: mention_count, most mentioned first
         """
         entries = self.sentiment_entries.get(proposal_id, [])
-        topic_counts = {}
-        
-        for entry in entries:
-            for topic in entry.key_topics:
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        return dict(sorted(topic_counts.items(), key=lambda x: x[1], reverse=True))
+        counts = Counter(chain.from_iterable(e.key_topics for e in entries))
+        return dict(counts.most_common(limit))
     
     def get_community_consensus(self, proposal_id: str) -> str:
         """
@@ -163,72 +322,37 @@ class SentimentMemory:
         Returns:
             "strong_support", "moderate_support", "neutral", "concern", "strong_opposition"
         """
-        sentiment = self.get_proposal_sentiment(proposal_id)
-        
-        if not sentiment:
+        score_sum, count = self._overall.get(proposal_id, (0.0, 0))
+        if count == 0:
             return "neutral"
-        
-        score = sentiment.get("overall_sentiment_score", 0)
-        
-        if score > 0.6:
-            return "strong_support"
-        elif score > 0.2:
-            return "moderate_support"
-        elif score > -0.2:
-            return "neutral"
-        elif score > -0.6:
-            return "concern"
-        else:
-            return "strong_opposition"
+
+        # Index straight into the label table instead of walking an
+        # if/elif ladder; the running aggregate already holds the score
+        return _CONSENSUS_LABELS[bisect_left(_CONSENSUS_THRESHOLDS, score_sum / count)]
     
+    def flush(self) -> None:
+        """Block until queued sentiment records have been persisted"""
+        membase_sink.flush()
+
     def _sync_to_membase(self, entry: SentimentEntry) -> None:
         """Sync sentiment data to Membase"""
         print(f"[MEMBASE] Syncing sentiment for {entry.proposal_id} from {entry.source}")
-        
-        # Save to disk to simulate Membase
+
+        # Hand the record to the shared sink; the background worker
+        # batches the JSONL appends off the recording path
         try:
-            import json
-            from pathlib import Path
-            from datetime import datetime
-            
-            storage_dir = Path("/tmp/eternalgov_membase_storage/sentiment")
-            storage_dir.mkdir(parents=True, exist_ok=True)
-            
-            filepath = storage_dir / f"{entry.proposal_id}.json"
-            
-            # Read existing or create new
-            if filepath.exists():
-                with open(filepath) as f:
-                    data = json.load(f)
-                    data["entries"].append({
-                        "dao": entry.dao,
-                        "source": entry.source,
-                        "sentiment_score": entry.sentiment_score,
-                        "support_count": entry.support_count,
-                        "opposition_count": entry.opposition_count,
-                        "neutral_count": entry.neutral_count,
-                        "topics": entry.topics,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-            else:
-                data = {
-                    "proposal_id": entry.proposal_id,
-                    "entries": [{
-                        "dao": entry.dao,
-                        "source": entry.source,
-                        "sentiment_score": entry.sentiment_score,
-                        "support_count": entry.support_count,
-                        "opposition_count": entry.opposition_count,
-                        "neutral_count": entry.neutral_count,
-                        "topics": entry.topics,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }],
-                    "membase_account": "default"
-                }
-            
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            print(f"[MEMBASE] ✅ Synced sentiment to Membase at {filepath}")
+            record = {
+                "proposal_id": entry.proposal_id,
+                "dao": entry.dao,
+                "source": entry.source,
+                "sentiment_score": entry.sentiment_score,
+                "support_count": entry.support_count,
+                "opposition_count": entry.opposition_count,
+                "neutral_count": entry.neutral_count,
+                "topics": entry.key_topics,
+                "timestamp": membase_sink.now_iso_cached(),
+                "membase_account": "default"
+            }
+            membase_sink.put("sentiment", entry.proposal_id, record)
         except Exception as e:
             print(f"[WARNING] Failed to sync sentiment: {str(e)}")
@@ -0,0 +1,64 @@
+"""
+Numeric scoring kernel for vote reasoning
+JIT-compiled with Numba when available, pure Python otherwise
+"""
+
+from statistics import fmean
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bucket ids returned by the kernel; kept in step with the decision
+# table in vote_reasoning._generate_decision
+SUPPORT = 0
+OPPOSE = 1
+MIXED = 2
+
+
+def score_maps(sentiment, preferences):
+    """
+    Score a proposal from its sentiment and preference maps
+
+    Args:
+        sentiment: source -> sentiment score
+        preferences: category -> preference rate
+
+    Returns:
+        (overall_sentiment, preference_alignment, bucket) where bucket
+        is one of SUPPORT, OPPOSE, MIXED
+    """
+    if NUMBA_AVAILABLE:
+        return _score_jit(
+            np.fromiter(sentiment.values(), dtype=np.float64, count=len(sentiment)),
+            np.fromiter(preferences.values(), dtype=np.float64, count=len(preferences))
+        )
+    overall = fmean(sentiment.values()) if sentiment else 0.0
+    alignment = fmean(preferences.values()) if preferences else 0.0
+    if overall > 0.5 and alignment > 0.5:
+        bucket = SUPPORT
+    elif overall < -0.3 or alignment < 0.3:
+        bucket = OPPOSE
+    else:
+        bucket = MIXED
+    return overall, alignment, bucket
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _score_jit(sentiment_values, preference_values):
+        """Machine-code scoring loop over packed float64 arrays"""
+        n = sentiment_values.size
+        overall = sentiment_values.sum() / n if n else 0.0
+        m = preference_values.size
+        alignment = preference_values.sum() / m if m else 0.0
+        if overall > 0.5 and alignment > 0.5:
+            bucket = 0
+        elif overall < -0.3 or alignment < 0.3:
+            bucket = 1
+        else:
+            bucket = 2
+        return overall, alignment, bucket
@@ -3,13 +3,78 @@ Vote Justification Reporter for EternalGov
 Creates transparent, on-chain recordable vote justifications
 """
 
+from collections import OrderedDict
 from typing import Dict, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
 import json
+import operator
+import re
+import sys
 
+from functools import lru_cache
+from hashlib import sha256
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+# Detail keywords compiled into one alternation: a single scan of the
+# reasoning replaces six independent substring passes plus the full
+# lowercased copy they needed
+_DETAIL_RE = re.compile(r"analyze|consider|evidence|data|pattern|trend", re.IGNORECASE)
+
+
+# Serialized report projection: attrgetter pulls all seven slot
+# fields in one C-level tuple build per report
+_REPORT_KEYS = (
+    "vote_choice", "confidence", "timestamp", "reasoning_hash",
+    "summary", "risk_level", "transparency_score"
+)
+_REPORT_GETTER = operator.attrgetter(*_REPORT_KEYS)
+
+# Canonical instances for the closed vote/risk vocabulary stored on
+# every archived report
+_VOCAB = {s: sys.intern(s) for s in (
+    "for", "against", "abstain", "low", "medium", "high"
+)}
+
+# Upper bound on memoized markdown renders held per reporter
+_MD_CACHE_SIZE = 256
+
+# Summary template built once at import; each call only fills the
+# slots instead of re-materializing the full f-string segment list
+_SUMMARY_TMPL = """
+EternalGov recommends voting **{choice}** with {confidence:.0%} confidence.
+
+**Key Metrics:**
+- Community Sentiment: {sentiment:+.2f}
+- Preference Alignment: {alignment:.0%}
+- Risk Assessment: {risk}
+
+This recommendation is based on analysis of community discussions across Snapshot, governance forums,
+social media, and historical voting patterns. The decision prioritizes long-term DAO value alignment
+and community consensus.
+""".strip()
+
+
+@lru_cache(maxsize=1024)
+def _hash_reasoning(reasoning: str) -> str:
+    """Hash reasoning text to its 16-hex-char on-chain reference"""
+    # One-shot digest keeps OpenSSL on its hardware SHA path; taking 8
+    # bytes before hex conversion skips building the full 64-char digest
+    return sha256(reasoning.encode()).digest()[:8].hex()
+
+
+@dataclass(slots=True, frozen=True)
 class VoteJustificationReport:
     """Structured report of vote justification"""
     proposal_id: str
@@ -34,6 +99,9 @@ class JustificationReporter:
     def __init__(self):
         """Initialize justification reporter"""
         self.reports: Dict[str, VoteJustificationReport] = {}
+        # Rendered markdown keyed by (proposal_id, reasoning_hash);
+        # reports are immutable, so the render is too. LRU-bounded.
+        self._md_cache: "OrderedDict[tuple, str]" = OrderedDict()
     
     def create_justification_report(
         self,
@@ -63,6 +131,10 @@ class JustificationReporter:
             VoteJustificationReport
         """
         
+        # Collapse vocabulary fields to their canonical instances
+        vote_choice = _VOCAB.get(vote_choice, vote_choice)
+        risk_level = _VOCAB.get(risk_level, risk_level)
+
         # Generate justification hash
         justification_hash = self._hash_justification(reasoning)
         
@@ -78,7 +150,7 @@ class JustificationReporter:
         report = VoteJustificationReport(
             proposal_id=proposal_id,
             vote_choice=vote_choice,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(timespec="microseconds"),
             confidence=confidence,
             reasoning_hash=justification_hash,
             summary=summary,
@@ -97,66 +169,137 @@ class JustificationReporter:
         """Retrieve a justification report"""
         return self.reports.get(proposal_id)
     
-    def get_reports_for_json(self) -> str:
-        """Export all reports as JSON"""
-        reports_dict = {
-            pid: {
-                "vote_choice": r.vote_choice,
-                "confidence": r.confidence,
-                "timestamp": r.timestamp,
-                "reasoning_hash": r.reasoning_hash,
-                "summary": r.summary,
-                "risk_level": r.risk_level,
-                "transparency_score": r.transparency_score
-            }
+    def _reports_as_dict(self) -> Dict[str, Dict]:
+        """Project all reports into plain dictionaries for serialization"""
+        return {
+            pid: dict(zip(_REPORT_KEYS, _REPORT_GETTER(r)))
             for pid, r in self.reports.items()
         }
+
+    def get_reports_for_json(self) -> str:
+        """Export all reports as JSON"""
+        reports_dict = self._reports_as_dict()
+        if orjson is not None:
+            # C-level serialization; several times faster than the
+            # stdlib once the report archive grows
+            return orjson.dumps(reports_dict, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(reports_dict, indent=2)
     
-    def get_full_report_markdown(self, proposal_id: str) -> Optional[str]:
-        """Get a report in Markdown format for transparency"""
-        
-        report = self.get_report(proposal_id)
-        if not report:
-            return None
-        
-        markdown = f"""
-# EternalGov Vote Justification Report
-
-## Proposal {report.proposal_id}
-
-**Vote Choice:** {report.vote_choice}  
-**Confidence:** {report.confidence:.1%}  
-**Risk Level:** {report.risk_level}  
-**Transparency Score:** {report.transparency_score:.1%}  
-**Timestamp:** {report.timestamp}
+    def dump_to_file(self, path: str) -> None:
+        """
+        Write the JSON report export to disk in one call
 
-## Summary
+        Args:
+            path: Destination file path
+        """
+        # Serialize to a single bytes buffer first so the file sees one
+        # write instead of a syscall per container delimiter
+        reports_dict = self._reports_as_dict()
+        if orjson is not None:
+            payload = orjson.dumps(reports_dict, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(reports_dict, indent=2).encode()
+        with open(path, "wb") as fp:
+            fp.write(payload)
 
-{report.summary}
+    def save_snapshot(self, path: str) -> None:
+        """
+        Persist all reports to a binary snapshot on disk
 
-## Sentiment Analysis
+        Args:
+            path: Destination file path
+        """
+        snapshot = {pid: asdict(r) for pid, r in self.reports.items()}
+        with open(path, "wb") as f:
+            if MSGPACK_AVAILABLE:
+                # One C-level pack of the full archive; a fraction of the
+                # JSON tokenizer cost and bytes on disk
+                msgpack.pack(snapshot, f, use_bin_type=True)
+            else:
+                f.write(json.dumps(snapshot).encode())
 
-| Source | Score |
-|--------|-------|
-{chr(10).join(f"| {source} | {score:+.2f} |" for source, score in report.sentiment_snapshot.items())}
+    def load_snapshot(self, path: str) -> int:
+        """
+        Restore reports from a binary snapshot
 
-**Preference Alignment:** {report.preference_alignment:.1%}
+        Args:
+            path: Snapshot file path
 
-## Data Sources
+        Returns:
+            Number of reports loaded
+        """
+        with open(path, "rb") as f:
+            if MSGPACK_AVAILABLE:
+                snapshot = msgpack.unpack(f, raw=False)
+            else:
+                snapshot = json.loads(f.read())
 
-{chr(10).join(f"- **{source}:** {contribution}" for source, contribution in report.data_sources.items())}
+        for pid, record in snapshot.items():
+            self.reports[pid] = VoteJustificationReport(**record)
+        return len(snapshot)
 
-## Detailed Reasoning
+    def get_full_report_markdown(self, proposal_id: str) -> Optional[str]:
+        """Get a report in Markdown format for transparency"""
+        
+        report = self.get_report(proposal_id)
+        if not report:
+            return None
 
-{report.detailed_reasoning}
+        cache_key = (proposal_id, report.reasoning_hash)
+        cached = self._md_cache.get(cache_key)
+        if cached is not None:
+            self._md_cache.move_to_end(cache_key)
+            return cached
 
----
+        # Accumulate lines and join once at the end; large sentiment or
+        # data-source tables grow the document without re-concatenation
+        parts = [
+            "# EternalGov Vote Justification Report",
+            "",
+            f"## Proposal {report.proposal_id}",
+            "",
+            f"**Vote Choice:** {report.vote_choice}  ",
+            f"**Confidence:** {report.confidence:.1%}  ",
+            f"**Risk Level:** {report.risk_level}  ",
+            f"**Transparency Score:** {report.transparency_score:.1%}  ",
+            f"**Timestamp:** {report.timestamp}",
+            "",
+            "## Summary",
+            "",
+            report.summary,
+            "",
+            "## Sentiment Analysis",
+            "",
+            "| Source | Score |",
+            "|--------|-------|",
+        ]
+        for source, score in report.sentiment_snapshot.items():
+            parts.append(f"| {source} | {score:+.2f} |")
+        parts += [
+            "",
+            f"**Preference Alignment:** {report.preference_alignment:.1%}",
+            "",
+            "## Data Sources",
+            "",
+        ]
+        for source, contribution in report.data_sources.items():
+            parts.append(f"- **{source}:** {contribution}")
+        parts += [
+            "",
+            "## Detailed Reasoning",
+            "",
+            report.detailed_reasoning,
+            "",
+            "---",
+            "",
+            "*This report is stored in Unibase's decentralized Membase for permanent verification.*  ",
+            f"*Reasoning Hash: {report.reasoning_hash}*",
+        ]
 
-*This report is stored in Unibase's decentralized Membase for permanent verification.*  
-*Reasoning Hash: {report.reasoning_hash}*
-        """.strip()
-        
+        markdown = "\n".join(parts)
+        self._md_cache[cache_key] = markdown
+        if len(self._md_cache) > _MD_CACHE_SIZE:
+            self._md_cache.popitem(last=False)
         return markdown
     
     def _create_summary(
@@ -168,31 +311,23 @@ class JustificationReporter:
         risk_level: str
     ) -> str:
         """Create a concise summary of the justification"""
-        
-        sentiment_avg = sum(sentiment_data.values()) / len(sentiment_data) if sentiment_data else 0
-        
-        summary = f"""
-EternalGov recommends voting **{vote_choice}** with {confidence:.0%} confidence.
 
-**Key Metrics:**
-- Community Sentiment: {sentiment_avg:+.2f}
-- Preference Alignment: {preference_alignment:.0%}
-- Risk Assessment: {risk_level}
+        sentiment_avg = sum(sentiment_data.values()) / len(sentiment_data) if sentiment_data else 0
 
-This recommendation is based on analysis of community discussions across Snapshot, governance forums, 
-social media, and historical voting patterns. The decision prioritizes long-term DAO value alignment 
-and community consensus.
-        """.strip()
-        
-        return summary
+        return _SUMMARY_TMPL.format(
+            choice=vote_choice,
+            confidence=confidence,
+            sentiment=sentiment_avg,
+            alignment=preference_alignment,
+            risk=risk_level
+        )
     
     def _hash_justification(self, reasoning: str) -> str:
         """
         Generate a hash of the reasoning for on-chain verification
         In production: use keccak256 or similar
         """
-        import hashlib
-        return hashlib.sha256(reasoning.encode()).hexdigest()[:16]
+        return _hash_reasoning(reasoning)
     
     def _calculate_transparency_score(
         self,
@@ -209,12 +344,13 @@ and community consensus.
         Returns:
             Transparency score (0.0 to 1.0)
         """
+        rlen = len(reasoning)
         score = 0.0
-        
+
         # Length of reasoning (more is better)
-        if len(reasoning) > 1000:
+        if rlen > 1000:
             score += 0.3
-        elif len(reasoning) > 500:
+        elif rlen > 500:
             score += 0.2
         
         # Number of data sources
@@ -226,9 +362,8 @@ and community consensus.
         elif num_sources >= 1:
             score += 0.2
         
-        # Detail in reasoning
-        detail_keywords = ["analyze", "consider", "evidence", "data", "pattern", "trend"]
-        keyword_count = sum(1 for kw in detail_keywords if kw in reasoning.lower())
+        # Detail in reasoning: count distinct keywords in one pass
+        keyword_count = len({m.group(0).lower() for m in _DETAIL_RE.finditer(reasoning)})
         score += min(0.3, keyword_count * 0.05)
         
         return min(1.0, score)
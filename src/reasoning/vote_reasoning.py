@@ -3,12 +3,18 @@ Vote Reasoning for EternalGov
 LLM-based decision pipeline for proposal analysis
 """
 
+import sys
+from collections import Counter
+from itertools import islice
+from statistics import fmean
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from . import _score_kernel
 
-@dataclass
+
+@dataclass(slots=True)
 class ReasoningContext:
     """Context for reasoning about a proposal"""
     proposal_id: str
@@ -24,7 +30,7 @@ class ReasoningContext:
     expected_impact: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VoteDecision:
     """Records a vote decision"""
     proposal_id: str
@@ -37,6 +43,35 @@ class VoteDecision:
     risk_assessment: str  # "low", "medium", "high"
 
 
+# Canonical instances for the closed vote/risk vocabulary; decisions
+# accumulate for a delegate's lifetime, so collapsing duplicate choice
+# strings to one backing object keeps the history compact
+_VOCAB = {s: sys.intern(s) for s in (
+    "for", "against", "abstain", "low", "medium", "high"
+)}
+
+# Analysis template built once at import; each call fills the slots
+# instead of re-materializing the full f-string segment list
+_ANALYSIS_TMPL = """
+EternalGov Vote Analysis for: {title}
+
+Recommendation: {choice}
+
+Primary Factors:
+{primary}
+
+Secondary Factors:
+{secondary}
+
+Community Sentiment Analysis:
+{sentiment}
+
+Expected Impact: {impact}...
+
+This recommendation aligns with historical DAO values and community preferences.
+""".strip()
+
+
 class VoteReasoning:
     """
     Implements LLM-based reasoning for governance decisions
@@ -73,24 +108,21 @@ class VoteReasoning:
         (Placeholder for LLM integration)
         """
         
-        # Analyze sentiment
-        overall_sentiment = sum(
-            context.community_sentiment.values()
-        ) / len(context.community_sentiment) if context.community_sentiment else 0
-        
-        # Analyze preference alignment
-        preference_alignment = sum(
-            context.historical_preferences.values()
-        ) / len(context.historical_preferences) if context.historical_preferences else 0
-        
-        # Determine best choice
-        if overall_sentiment > 0.5 and preference_alignment > 0.5:
+        # The numeric core (means + threshold buckets) lives in the
+        # kernel module so Numba can compile it when installed
+        overall_sentiment, preference_alignment, bucket = _score_kernel.score_maps(
+            context.community_sentiment,
+            context.historical_preferences
+        )
+
+        # Map the kernel's bucket back to the decision table
+        if bucket == _score_kernel.SUPPORT:
             choice = context.voting_options[0] if context.voting_options else "for"
             confidence = 0.75
             primary = ["strong_community_support", "alignment_with_values"]
             secondary = ["positive_expected_impact"]
             risk = "low"
-        elif overall_sentiment < -0.3 or preference_alignment < 0.3:
+        elif bucket == _score_kernel.OPPOSE:
             choice = context.voting_options[-1] if context.voting_options else "against"
             confidence = 0.6
             primary = ["community_concerns", "misalignment_with_preferences"]
@@ -103,6 +135,7 @@ class VoteReasoning:
             secondary = ["requires_further_analysis"]
             risk = "medium"
         
+        choice = _VOCAB.get(choice, choice)
         reasoning = self._build_reasoning_summary(context, choice, primary, secondary)
         alignment = (overall_sentiment + preference_alignment) / 2
         
@@ -125,27 +158,18 @@ class VoteReasoning:
         secondary: List[str]
     ) -> str:
         """Build human-readable reasoning summary"""
-        
-        summary = f"""
-EternalGov Vote Analysis for: {context.proposal_title}
-
-Recommendation: {choice.upper()}
-
-Primary Factors:
-{chr(10).join(f"  • {f}" for f in primary)}
-
-Secondary Factors:
-{chr(10).join(f"  • {f}" for f in secondary)}
 
-Community Sentiment Analysis:
-{chr(10).join(f"  • {source}: {score:.2f}" for source, score in context.community_sentiment.items())}
-
-Expected Impact: {context.expected_impact[:200]}...
-
-This recommendation aligns with historical DAO values and community preferences.
-        """.strip()
-        
-        return summary
+        return _ANALYSIS_TMPL.format(
+            title=context.proposal_title,
+            choice=choice.upper(),
+            primary="\n".join(f"  • {f}" for f in primary),
+            secondary="\n".join(f"  • {f}" for f in secondary),
+            sentiment="\n".join(
+                f"  • {source}: {score:.2f}"
+                for source, score in context.community_sentiment.items()
+            ),
+            impact=context.expected_impact[:200]
+        )
     
     def get_decision_history(self) -> Dict[str, VoteDecision]:
         """Get all vote decisions"""
@@ -160,31 +184,41 @@ This recommendation aligns with historical DAO values and community preferences.
         """
         if not self.decision_history:
             return {}
-        
-        decisions = list(self.decision_history.values())
-        
-        # Analyze decision patterns
-        patterns = {
-            "average_confidence": sum(d.confidence for d in decisions) / len(decisions),
-            "most_common_choice": max(
-                set(d.choice for d in decisions),
-                key=list(d.choice for d in decisions).count,
-                default=None
-            ),
-            "risk_distribution": {},
+
+        decisions = self.decision_history.values()
+
+        # One counting pass each for choices and risks instead of the
+        # old O(choices x decisions) list.count scan
+        choice_counts = Counter(d.choice for d in decisions)
+        risk_counts = Counter(d.risk_assessment for d in decisions)
+
+        return {
+            "average_confidence": fmean(d.confidence for d in decisions),
+            "most_common_choice": choice_counts.most_common(1)[0][0],
+            "risk_distribution": dict(risk_counts),
             "decision_count": len(decisions)
         }
-        
-        # Risk distribution
-        for decision in decisions:
-            risk = decision.risk_assessment
-            patterns["risk_distribution"][risk] = patterns["risk_distribution"].get(risk, 0) + 1
-        
-        return patterns
     
     def _build_reasoning_prompt(self, context: ReasoningContext) -> str:
         """Build LLM prompt for proposal analysis"""
-        
+
+        # islice feeds the joins straight from the source lists; the
+        # [:3] slices each made a shallow copy first
+        sentiment = "\n".join(
+            f"  • {source}: {score:.2f}"
+            for source, score in context.community_sentiment.items()
+        )
+        args_for = "\n".join(
+            f"  • {arg}" for arg in islice(context.arguments_for, 3)
+        )
+        args_against = "\n".join(
+            f"  • {arg}" for arg in islice(context.arguments_against, 3)
+        )
+        history = "\n".join(
+            f"  • {p.get('title', 'Unknown')}: {p.get('outcome', 'Unknown')}"
+            for p in islice(context.similar_past_proposals, 3)
+        )
+
         prompt = f"""
 Analyze this DAO governance proposal and determine the optimal vote:
 
@@ -197,17 +231,17 @@ Proposal Details:
 Voting Options: {', '.join(context.voting_options)}
 
 Community Sentiment:
-{chr(10).join(f"  • {s}: {context.community_sentiment.get(s, 0):.2f}" for s in context.community_sentiment.keys())}
+{sentiment}
 
 Arguments For:
-{chr(10).join(f"  • {arg}" for arg in context.arguments_for[:3])}
+{args_for}
 
 Arguments Against:
-{chr(10).join(f"  • {arg}" for arg in context.arguments_against[:3])}
+{args_against}
 
 Historical Context:
 Similar past proposals and their outcomes:
-{chr(10).join(f"  • {p.get('title', 'Unknown')}: {p.get('outcome', 'Unknown')}" for p in context.similar_past_proposals[:3])}
+{history}
 
 Based on this analysis, what should EternalGov vote? Provide:
 1. Vote recommendation (for/against/abstain)
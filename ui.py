@@ -4,13 +4,14 @@ A decentralized AI DAO delegate powered by Unibase Membase
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
 import json
 from config.config import get_config
 from eternal_gov import EternalGov
-from data_ingestion_service import DataIngestionService
 from membase_viewer import MembaseStorageViewer
 
 # Page config
@@ -21,8 +22,304 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+
+# The viewer is a process-wide resource: construct it once instead of
+# on every Memory-page rerun
+@st.cache_resource
+def get_membase_viewer():
+    return MembaseStorageViewer()
+
+
+# Cached Membase queries: Streamlit reruns the whole script on every
+# widget interaction, so without caching each rerun re-reads and
+# re-parses every JSON file in storage. The TTL keeps the Memory page
+# fresh without hitting disk per keystroke.
+@st.cache_data(ttl=30)
+def _membase_summary():
+    return get_membase_viewer().get_summary()
+
+
+@st.cache_data(ttl=30)
+def _membase_proposals():
+    return get_membase_viewer().get_proposals()
+
+
+@st.cache_data(ttl=30)
+def _membase_documents():
+    return get_membase_viewer().get_documents()
+
+
+@st.cache_data(ttl=30)
+def _membase_conversations():
+    return get_membase_viewer().get_conversations()
+
+
+@st.cache_data(ttl=30)
+def _membase_conversation_previews():
+    return get_membase_viewer().get_conversation_previews()
+
+
+@st.cache_data(ttl=30)
+def _membase_conversation(conv_id: str):
+    return get_membase_viewer().get_conversation(conv_id)
+
+
+@st.cache_data(ttl=5)
+def _get_status(gov_id: int):
+    """Governor status, shared by the sidebar and every page for 5s
+
+    Keyed by the governor's object id so a re-initialized agent is not
+    served the previous instance's cached status.
+    """
+    return st.session_state.governor.get_status()
+
+
+# Figure assembly is pure in its inputs, so cache the built figures:
+# unchanged numbers skip both trace construction and the figure-JSON
+# serialization Streamlit does on every rerun
+@st.cache_data
+def build_activity_figure(dates, proposals, votes):
+    # Imported here so non-chart pages (Settings, Voting) never pay
+    # plotly's import chain; cache hits skip it entirely
+    import plotly.graph_objects as go
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        FigureResampler = None
+
+    fig = go.Figure()
+    if FigureResampler is not None:
+        # LTTB downsampling bounds the rendered point count once
+        # real history replaces the 7-point sample data
+        fig = FigureResampler(fig, default_n_shown_samples=500)
+    fig.add_trace(go.Scatter(x=dates, y=proposals, mode='lines+markers', name='Proposals', line=dict(color='#1f77b4', width=3)))
+    fig.add_trace(go.Scatter(x=dates, y=votes, mode='lines+markers', name='Votes Cast', line=dict(color='#ff7f0e', width=3)))
+
+    fig.update_layout(
+        title="Last 7 Days Activity",
+        xaxis_title="Date",
+        yaxis_title="Count",
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+
+@st.cache_data
+def build_vote_distribution_figure(vote_rows: tuple):
+    import plotly.express as px
+
+    df = pd.DataFrame(vote_rows, columns=["id", "category", "count"])
+    # int32 counts keep plotly on its typed-array serialization fast
+    # path, matching the activity chart's arrays, instead of encoding
+    # the inferred int64 column element by element
+    df["count"] = df["count"].to_numpy(dtype=np.int32)
+    fig = px.bar(
+        df,
+        x="category", y="count",
+        facet_col="id", facet_col_wrap=3,
+        color="category",
+        color_discrete_map={
+            "For": "#09AB3B", "Against": "#FF2B2B", "Abstain": "#FFB703"
+        }
+    )
+    fig.update_layout(height=300, showlegend=False, margin=dict(l=0, r=0, t=30, b=0))
+    return fig
+
+
+def _ingest_one(dao_name: str) -> None:
+    """Ingest one DAO in a worker process with its own event loop"""
+    # Local imports keep the worker self-contained: each process gets
+    # a fresh service and a fresh loop, so leaked sessions or loop
+    # state can't bleed between DAOs or back into the UI process
+    import asyncio
+    from data_ingestion_service import DataIngestionService
+
+    service = DataIngestionService()
+    asyncio.run(service.ingest_dao(dao_name))
+
+
+# Upper bound on entries rendered per Memory tab page: keeps widget
+# count (and websocket traffic) constant as the store grows
+PAGE_SIZE = 20
+
+# Constant display tables built once at import instead of per rerun
+INGEST_DAOS = ("uniswap", "aave", "compound", "makerdao")
+
+COMPONENT_STATUS = {
+    "Membase Integration": "🟢 Connected",
+    "Memory Manager": "🟢 Active",
+    "Reasoning Engine": "🟢 Ready",
+    "Blockchain": "🟢 Synced",
+    "Data Ingestion": "🟢 Running"
+}
+
+DAO_DISPLAY_NAMES = ("🦄 Uniswap", "🏛️ Aave", "🌾 Compound", "🔷 MakerDAO")
+
+SUPPORTED_DAOS = {
+    "Uniswap": {"symbol": "UNI", "enabled": True},
+    "Aave": {"symbol": "AAVE", "enabled": True},
+    "Compound": {"symbol": "COMP", "enabled": True},
+    "MakerDAO": {"symbol": "MKR", "enabled": True}
+}
+
+
+def _paginate(items, key: str):
+    """Slice a listing to the selected page, with a page picker"""
+    if len(items) <= PAGE_SIZE:
+        return items
+    pages = -(-len(items) // PAGE_SIZE)
+    page_num = st.number_input(
+        f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key
+    )
+    start = (page_num - 1) * PAGE_SIZE
+    return items[start:start + PAGE_SIZE]
+
+
+@st.fragment
+def _render_proposals_tab():
+    """Memory tab: stored proposals (fetched only when rendered)"""
+    st.subheader("Stored Proposals")
+
+    proposals = _membase_proposals()
+    if proposals:
+        st.caption(f"{len(proposals)} proposals stored")
+        for prop in _paginate(proposals, "proposals_page"):
+            with st.container(border=True):
+                col1, col2, col3 = st.columns([2, 1, 1])
+                prop_id = prop.get('proposal_id', prop.get('id', 'UNKNOWN'))
+                dao = prop.get('dao', 'unknown').upper()
+                with col1:
+                    st.markdown(f"**{prop_id} - {prop.get('title', 'Untitled')}**")
+                    st.caption(f"Author: {prop.get('author', 'Unknown')} | DAO: {dao}")
+                    st.caption(f"Category: {prop.get('category', 'general')}")
+                with col2:
+                    st.markdown(f"**Status**: {prop.get('status', 'active')}")
+                with col3:
+                    stored = prop.get('stored_at', 'N/A')
+                    st.markdown(f"**Stored**: {stored[:10] if stored else 'N/A'}")
+
+                body = prop.get('body', 'No description')
+                st.markdown(f"*{body[:200]}...*")
+    else:
+        st.info("📝 No proposals stored yet. Run data ingestion to populate.")
+
+
+@st.fragment
+def _render_documents_tab():
+    """Memory tab: stored documents (fetched only when rendered)"""
+    st.subheader("Stored Documents")
+
+    documents = _membase_documents()
+    if documents:
+        st.caption(f"{len(documents)} documents stored")
+        for doc in _paginate(documents, "documents_page"):
+            with st.container(border=True):
+                col1, col2 = st.columns([3, 1])
+                doc_id = doc.get('doc_id', doc.get('id', 'UNKNOWN'))
+                doc_type = doc.get('doc_type', doc.get('type', 'document'))
+                source = doc.get('source', 'unknown')
+                with col1:
+                    st.markdown(f"**{doc_id}**")
+                    st.caption(f"Type: {doc_type} | Source: {source}")
+                with col2:
+                    stored = doc.get('stored_at', 'N/A')
+                    st.markdown(f"**{stored[:10] if stored else 'N/A'}**")
+    else:
+        st.info("📄 No documents stored yet.")
+
+
+@st.fragment
+def _render_conversations_tab():
+    """Memory tab: stored conversations (fetched only when rendered)"""
+    st.subheader("Stored Conversations")
+
+    # Listing works from lightweight previews; full message payloads
+    # are only read from disk when a conversation is expanded
+    previews = _membase_conversation_previews()
+    if previews:
+        st.caption(f"{len(previews)} conversations stored")
+        for preview in _paginate(previews, "conversations_page"):
+            with st.container(border=True):
+                col1, col2 = st.columns([3, 1])
+                stored = preview['stored_at']
+                with col1:
+                    st.markdown(f"**{preview['id']}**")
+                    st.caption(f"Messages: {preview['msg_count']}")
+                with col2:
+                    st.markdown(f"**{stored[:10] if stored else 'N/A'}**")
+
+                if preview['first_msg_preview']:
+                    st.markdown(f"*Latest: {preview['first_msg_preview']}...*")
+
+                if preview['msg_count'] and st.checkbox(
+                    "Show full conversation", key=f"conv_full_{preview['id']}"
+                ):
+                    st.json(_membase_conversation(preview['id']))
+    else:
+        st.info("💬 No conversations stored yet.")
+
+
+@st.fragment
+def _render_storage_tab():
+    """Memory tab: storage layout and raw data inspector"""
+    st.subheader("Membase Storage Details")
+
+    st.markdown("**Membase Hub Storage Structure:**")
+    st.code("""
+/tmp/eternalgov_membase_storage/
+├── proposals/        # Governance proposals
+├── documents/        # Knowledge base documents
+├── conversations/    # Multi-memory conversations
+└── sentiment/        # Community sentiment data
+    """, language="text")
+
+    st.markdown("**Membase Integration:**")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        ✅ **MultiMemory Component**
+        - Conversations synced
+        - Thread-safe storage
+        - Hub auto-upload enabled
+        """)
+
+    with col2:
+        st.markdown("""
+        ✅ **ChromaKnowledgeBase**
+        - Vector embeddings
+        - Semantic search
+        - Decentralized DA
+        """)
+
+    # Show raw data option; data is only fetched once the box is ticked
+    if st.checkbox("Show Raw Membase Data"):
+        st.subheader("Raw Membase Storage")
+
+        proposals = _membase_proposals()
+        st.write("**Proposals:**")
+        st.json(proposals[:1] if proposals else {})
+
+        conversations = _membase_conversations()
+        st.write("**Conversations:**")
+        st.json(conversations[:1] if conversations else {})
+
+
+def _clear_membase_caches():
+    """Invalidate cached Membase reads after new data is ingested"""
+    _membase_summary.clear()
+    _membase_proposals.clear()
+    _membase_documents.clear()
+    _membase_conversations.clear()
+    _membase_conversation_previews.clear()
+    _membase_conversation.clear()
+
+# Custom CSS: the string is built once at import, but it must be
+# re-emitted on every run — Streamlit drops elements that a rerun
+# doesn't re-emit, so a session-gated inject loses the styling on the
+# first full rerun (e.g. switching pages in the sidebar)
+_CUSTOM_CSS = """
     <style>
     .main {
         padding-top: 2rem;
@@ -48,15 +345,15 @@ st.markdown("""
         border-radius: 0.5rem;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-# Initialize session state
-if 'governor' not in st.session_state:
-    st.session_state.governor = None
-if 'config' not in st.session_state:
-    st.session_state.config = None
-if 'service' not in st.session_state:
-    st.session_state.service = None
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+# Initialize session state: setdefault only touches missing keys, so
+# adding a new default is one line instead of another membership check
+SESSION_DEFAULTS = {'governor': None, 'config': None}
+for key, value in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, value)
 
 # Sidebar
 with st.sidebar:
@@ -76,40 +373,48 @@ with st.sidebar:
             st.error(f"Failed to initialize: {str(e)}")
     
     # Data ingestion button
-    if st.session_state.get('governor') and st.button("🔍 Start Data Ingestion", use_container_width=True):
+    if st.session_state.get('governor') and st.button(
+        "🔍 Start Data Ingestion",
+        use_container_width=True,
+        disabled=st.session_state.get('ingestion_running', False)
+    ):
         try:
+            st.session_state.ingestion_running = True
             with st.spinner("🔍 Searching and ingesting governance data..."):
-                # Create service
-                service = DataIngestionService()
-                service.governor = st.session_state.governor
-                
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Ingest for each DAO
-                daos = ["uniswap", "aave", "compound", "makerdao"]
-                for idx, dao in enumerate(daos):
-                    status_text.text(f"📊 Ingesting {dao.upper()} data and storing in Membase...")
-                    progress = (idx + 1) / len(daos)
-                    progress_bar.progress(progress)
-                    
-                    try:
-                        # Simplified sync - actual async handled by service
-                        import asyncio
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(service.ingest_dao(dao))
-                        loop.close()
-                    except Exception as e:
-                        pass  # Silently handle - data cached locally
-                
+                # Each DAO runs in its own worker process with its own
+                # event loop: ingestion parallelizes across cores and a
+                # misbehaving HTTP session can't poison the UI process
+                daos = INGEST_DAOS
+                status_text.text("📊 Ingesting governance data and storing in Membase...")
+
+                with ProcessPoolExecutor(max_workers=4) as executor:
+                    futures = {executor.submit(_ingest_one, dao): dao for dao in daos}
+                    # Every progress/text update is a websocket message
+                    # and a frontend repaint; throttle intermediate
+                    # updates so fast completions don't flood the UI
+                    last_update = time.monotonic()
+                    for done, future in enumerate(as_completed(futures), 1):
+                        try:
+                            future.result()
+                        except Exception:
+                            pass  # Silently handle - data cached locally
+                        now = time.monotonic()
+                        if done == len(daos) or now - last_update > 0.25:
+                            progress_bar.progress(done / len(daos))
+                            status_text.text(f"📊 Ingested {done}/{len(daos)} DAOs...")
+                            last_update = now
+
                 progress_bar.progress(1.0)
                 status_text.text("✅ Data ingestion complete! Checking Membase...")
                 st.success("🎉 Governance data synced to Membase!")
-                st.session_state.service = service
-                
+
         except Exception as e:
             st.error(f"Error during data ingestion: {str(e)}")
+        finally:
+            st.session_state.ingestion_running = False
     
     st.divider()
     
@@ -126,7 +431,7 @@ with st.sidebar:
     # System Info
     st.subheader("System Info")
     if st.session_state.governor:
-        status = st.session_state.governor.get_status()
+        status = _get_status(id(st.session_state.governor))
         col1, col2 = st.columns(2)
         with col1:
             st.metric("Agent", status.get('agent_name', 'EternalGov'))
@@ -136,15 +441,18 @@ with st.sidebar:
     else:
         st.info("💡 Initialize EternalGov to get started")
 
-# Main content
-if page == "Dashboard":
+# Each page renders inside its own fragment: widget interactions on a
+# page rerun just that fragment instead of the whole script, and the
+# dict dispatch below replaces the if/elif chain
+@st.fragment
+def render_dashboard():
     st.title("🤖 EternalGov Dashboard")
     
     if not st.session_state.governor:
         st.warning("Please initialize EternalGov from the sidebar first, then click 'Start Data Ingestion'")
     else:
         governor = st.session_state.governor
-        status = governor.get_status()
+        status = _get_status(id(governor))
         
         # Key Metrics
         st.subheader("Key Metrics")
@@ -187,20 +495,12 @@ if page == "Dashboard":
         
         with col1:
             st.subheader("Component Status")
-            components = {
-                "Membase Integration": "🟢 Connected",
-                "Memory Manager": "🟢 Active",
-                "Reasoning Engine": "🟢 Ready",
-                "Blockchain": "🟢 Synced",
-                "Data Ingestion": "🟢 Running"
-            }
-            for component, status_text in components.items():
+            for component, status_text in COMPONENT_STATUS.items():
                 st.markdown(f"**{component}**: {status_text}")
         
         with col2:
             st.subheader("Supported DAOs")
-            daos = ["🦄 Uniswap", "🏛️ Aave", "🌾 Compound", "🔷 MakerDAO"]
-            for dao in daos:
+            for dao in DAO_DISPLAY_NAMES:
                 st.markdown(f"• {dao}")
         
         st.divider()
@@ -208,25 +508,18 @@ if page == "Dashboard":
         # Activity Chart
         st.subheader("Activity Timeline")
         
-        # Generate sample data
-        dates = [(datetime.now() - timedelta(days=i)).date() for i in range(7)]
-        proposals = [3, 5, 4, 6, 7, 5, 4]
-        votes = [2, 4, 3, 5, 6, 4, 3]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=dates, y=proposals, mode='lines+markers', name='Proposals', line=dict(color='#1f77b4', width=3)))
-        fig.add_trace(go.Scatter(x=dates, y=votes, mode='lines+markers', name='Votes Cast', line=dict(color='#ff7f0e', width=3)))
-        
-        fig.update_layout(
-            title="Last 7 Days Activity",
-            xaxis_title="Date",
-            yaxis_title="Count",
-            hovermode='x unified',
-            height=400
-        )
+        # Generate sample data: one vectorized date_range call instead
+        # of a Python datetime per day, and int32 arrays so plotly uses
+        # its typed-array fast path
+        dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=7, freq="D")
+        proposals = np.asarray([3, 5, 4, 6, 7, 5, 4], dtype=np.int32)
+        votes = np.asarray([2, 4, 3, 5, 6, 4, 3], dtype=np.int32)
+
+        fig = build_activity_figure(dates, proposals, votes)
         st.plotly_chart(fig, use_container_width=True)
 
-elif page == "Proposals":
+@st.fragment
+def render_proposals():
     st.title("📋 Proposals")
     
     if not st.session_state.governor:
@@ -284,59 +577,75 @@ elif page == "Proposals":
             }
         ]
         
-        for prop in proposals_data:
+        # One data-grid widget instead of a bordered container, three
+        # columns, and several markdown elements per proposal; the grid
+        # virtualizes rows, so the element count stays flat as the
+        # proposal list grows
+        df = pd.DataFrame(proposals_data)
+        selection = st.dataframe(
+            df,
+            column_config={
+                "id": st.column_config.TextColumn("Proposal"),
+                "eternalgov_vote": st.column_config.TextColumn("EternalGov Vote"),
+                "confidence": st.column_config.ProgressColumn(
+                    "Confidence", min_value=0, max_value=100, format="%d%%"
+                ),
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="proposals_table",
+        )
+
+        # Detail view for the selected row only
+        selected_rows = selection.selection.rows
+        if selected_rows:
+            prop = proposals_data[selected_rows[0]]
             with st.container(border=True):
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                prop_id = prop.get('id', prop.get('proposal_id', 'UNKNOWN'))
-                title = prop.get('title', 'Untitled')
-                dao = prop.get('dao', 'unknown').upper()
-                status = prop.get('status', 'active')
-                eternalgov_vote = prop.get('eternalgov_vote', 'ABSTAIN')
-                confidence = prop.get('confidence', 0)
-                votes_for = prop.get('votes_for', 0)
-                votes_against = prop.get('votes_against', 0)
-                votes_abstain = prop.get('votes_abstain', 0)
-                
-                with col1:
-                    st.markdown(f"**{prop_id} - {title}**")
-                    st.caption(f"DAO: {dao} | Status: {status}")
-                
-                with col2:
-                    vote_color = "🟢" if eternalgov_vote == "FOR" else "🔴" if eternalgov_vote == "AGAINST" else "⚪"
-                    st.markdown(f"{vote_color} **{eternalgov_vote}**")
-                    st.caption(f"Confidence: {confidence}%")
-                
-                with col3:
-                    st.markdown(f"**{votes_for}** For")
-                    st.markdown(f"**{votes_against}** Against")
-                
-                # Voting distribution chart
-                fig = go.Figure(data=[
-                    go.Bar(x=['For', 'Against', 'Abstain'], y=[votes_for, votes_against, votes_abstain],
-                           marker=dict(color=['#09AB3B', '#FF2B2B', '#FFB703']))
-                ])
-                fig.update_layout(height=250, showlegend=False, margin=dict(l=0, r=0, t=0, b=0))
-                st.plotly_chart(fig, use_container_width=True, key=f"chart_{prop_id}")
-
-elif page == "Memory":
+                st.markdown(f"**{prop['id']} - {prop['title']}**")
+                st.caption(f"DAO: {prop['dao'].upper()} | Status: {prop['status']}")
+                vote = prop['eternalgov_vote']
+                vote_color = "🟢" if vote == "FOR" else "🔴" if vote == "AGAINST" else "⚪"
+                st.markdown(f"{vote_color} **{vote}** ({prop['confidence']}% confidence)")
+
+        vote_rows = []
+        for prop in proposals_data:
+            prop_id = prop.get('id', prop.get('proposal_id', 'UNKNOWN'))
+            vote_rows.extend((
+                (prop_id, "For", prop.get('votes_for', 0)),
+                (prop_id, "Against", prop.get('votes_against', 0)),
+                (prop_id, "Abstain", prop.get('votes_abstain', 0)),
+            ))
+
+        # One faceted figure for every proposal's vote distribution:
+        # a single plotly.js instance instead of one SVG chart per
+        # proposal, which re-layouts N times per rerun
+        if vote_rows:
+            st.subheader("Vote Distributions")
+            fig = build_vote_distribution_figure(tuple(vote_rows))
+            st.plotly_chart(fig, use_container_width=True, key="vote_distributions")
+
+@st.fragment
+def render_memory():
     st.title("💾 Decentralized Memory (Membase Hub)")
     
     if not st.session_state.governor:
         st.warning("Please initialize EternalGov from the sidebar first")
     else:
         governor = st.session_state.governor
-        status = governor.get_status()
-        
-        # Get real Membase data
-        membase_viewer = MembaseStorageViewer()
-        membase_summary = membase_viewer.get_summary()
-        proposals = membase_viewer.get_proposals()
-        documents = membase_viewer.get_documents()
-        conversations = membase_viewer.get_conversations()
+        status = _get_status(id(governor))
         
+        # Get real Membase data (cached across reruns); each tab
+        # fetches its own list lazily below
+        membase_summary = _membase_summary()
+
         # Memory layers overview
         st.subheader("Memory Stored in Membase Hub")
+
+        if st.button("🔄 Refresh Membase Data"):
+            _clear_membase_caches()
+            st.rerun()
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -356,118 +665,25 @@ elif page == "Memory":
         
         st.divider()
         
-        # Memory details
+        # Memory details: each tab is a fragment, so interactions
+        # inside one tab rerun just that tab, and each tab fetches its
+        # own data only when drawn
         tab1, tab2, tab3, tab4 = st.tabs(["Proposals", "Documents", "Conversations", "Storage"])
-        
+
         with tab1:
-            st.subheader("Stored Proposals")
-            
-            if proposals:
-                for prop in proposals:
-                    with st.container(border=True):
-                        col1, col2, col3 = st.columns([2, 1, 1])
-                        prop_id = prop.get('proposal_id', prop.get('id', 'UNKNOWN'))
-                        dao = prop.get('dao', 'unknown').upper()
-                        with col1:
-                            st.markdown(f"**{prop_id} - {prop.get('title', 'Untitled')}**")
-                            st.caption(f"Author: {prop.get('author', 'Unknown')} | DAO: {dao}")
-                            st.caption(f"Category: {prop.get('category', 'general')}")
-                        with col2:
-                            st.markdown(f"**Status**: {prop.get('status', 'active')}")
-                        with col3:
-                            stored = prop.get('stored_at', 'N/A')
-                            st.markdown(f"**Stored**: {stored[:10] if stored else 'N/A'}")
-                        
-                        body = prop.get('body', 'No description')
-                        st.markdown(f"*{body[:200]}...*")
-            else:
-                st.info("📝 No proposals stored yet. Run data ingestion to populate.")
-        
+            _render_proposals_tab()
+
         with tab2:
-            st.subheader("Stored Documents")
-            
-            if documents:
-                for doc in documents:
-                    with st.container(border=True):
-                        col1, col2 = st.columns([3, 1])
-                        doc_id = doc.get('doc_id', doc.get('id', 'UNKNOWN'))
-                        doc_type = doc.get('doc_type', doc.get('type', 'document'))
-                        source = doc.get('source', 'unknown')
-                        with col1:
-                            st.markdown(f"**{doc_id}**")
-                            st.caption(f"Type: {doc_type} | Source: {source}")
-                        with col2:
-                            stored = doc.get('stored_at', 'N/A')
-                            st.markdown(f"**{stored[:10] if stored else 'N/A'}**")
-            else:
-                st.info("📄 No documents stored yet.")
-        
+            _render_documents_tab()
+
         with tab3:
-            st.subheader("Stored Conversations")
-            
-            if conversations:
-                for conv in conversations:
-                    with st.container(border=True):
-                        col1, col2 = st.columns([3, 1])
-                        conv_id = conv.get('conversation_id', conv.get('id', 'UNKNOWN'))
-                        messages = conv.get('messages', [])
-                        stored = conv.get('stored_at', 'N/A')
-                        with col1:
-                            st.markdown(f"**{conv_id}**")
-                            st.caption(f"Messages: {len(messages)}")
-                        with col2:
-                            st.markdown(f"**{stored[:10] if stored else 'N/A'}**")
-                        
-                        # Show first message
-                        if messages:
-                            msg = messages[0]
-                            msg_content = msg.get('content', msg.get('text', 'No content')) if isinstance(msg, dict) else str(msg)
-                            st.markdown(f"*Latest: {msg_content[:150]}...*")
-            else:
-                st.info("💬 No conversations stored yet.")
-        
+            _render_conversations_tab()
+
         with tab4:
-            st.subheader("Membase Storage Details")
-            
-            st.markdown("**Membase Hub Storage Structure:**")
-            st.code("""
-/tmp/eternalgov_membase_storage/
-├── proposals/        # Governance proposals
-├── documents/        # Knowledge base documents
-├── conversations/    # Multi-memory conversations
-└── sentiment/        # Community sentiment data
-            """, language="text")
-            
-            st.markdown("**Membase Integration:**")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                ✅ **MultiMemory Component**
-                - Conversations synced
-                - Thread-safe storage
-                - Hub auto-upload enabled
-                """)
-            
-            with col2:
-                st.markdown("""
-                ✅ **ChromaKnowledgeBase**
-                - Vector embeddings
-                - Semantic search
-                - Decentralized DA
-                """)
-            
-            # Show raw data option
-            if st.checkbox("Show Raw Membase Data"):
-                st.subheader("Raw Membase Storage")
-                
-                st.write("**Proposals:**")
-                st.json(proposals[:1] if proposals else {})
-                
-                st.write("**Conversations:**")
-                st.json(conversations[:1] if conversations else {})
+            _render_storage_tab()
 
-elif page == "Voting":
+@st.fragment
+def render_voting():
     st.title("🗳️ Voting System")
     
     if not st.session_state.governor:
@@ -552,7 +768,8 @@ elif page == "Voting":
             threshold = st.slider("Minimum confidence for auto-vote", 50, 100, 80)
             st.caption(f"Only vote if confidence ≥ {threshold}%")
 
-elif page == "Settings":
+@st.fragment
+def render_settings():
     st.title("⚙️ Settings")
     
     st.subheader("Configuration")
@@ -589,14 +806,7 @@ elif page == "Settings":
     with tab3:
         st.markdown("**Supported DAOs**")
         
-        daos = {
-            "Uniswap": {"symbol": "UNI", "enabled": True},
-            "Aave": {"symbol": "AAVE", "enabled": True},
-            "Compound": {"symbol": "COMP", "enabled": True},
-            "MakerDAO": {"symbol": "MKR", "enabled": True}
-        }
-        
-        for dao_name, dao_info in daos.items():
+        for dao_name, dao_info in SUPPORTED_DAOS.items():
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.markdown(f"**{dao_name}** ({dao_info['symbol']})")
@@ -617,6 +827,16 @@ elif page == "Settings":
         if st.button("Export Configuration", type="secondary"):
             st.info("✅ Configuration exported")
 
+# Main content
+PAGE_RENDERERS = {
+    "Dashboard": render_dashboard,
+    "Proposals": render_proposals,
+    "Memory": render_memory,
+    "Voting": render_voting,
+    "Settings": render_settings,
+}
+PAGE_RENDERERS[page]()
+
 # Footer
 st.divider()
 st.markdown("""